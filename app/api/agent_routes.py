@@ -5,32 +5,35 @@ This module contains endpoints for managing agent state, conversation history,
 agent reset, and user preference initialization.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 import logging
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import ORJSONResponse
 
-from ..models.schemas import (
+from ..models import (
     AgentStateResponse,
     ConversationHistoryResponse,
     InitializePreferencesRequest,
     MemoryStoreResponse,
 )
 from ..services.agent_manager import AgentType
-from ..services.agent_service import AgentService
+from .body import json_body, json_body_openapi
+from .dependencies import AgentServiceDep
+from .errors import translate_errors
 
 logger = logging.getLogger(__name__)
 
 # Create API router
 router = APIRouter()
 
-# Global service instance
-agent_service = AgentService()
-
-
-def get_agent_service() -> AgentService:
-    """Dependency to get the agent service instance."""
-    return agent_service
+# Error details returned to clients; exception specifics are only logged
+_AGENT_STATE_FAILED = "Failed to get agent state"
+_HISTORY_FAILED = "Failed to get conversation history"
+_AGENT_NOT_FOUND_DOC = "The user has no active default memory agent"
+_RESET_FAILED = "Failed to reset agent"
+_PREFERENCES_FAILED = "Failed to initialize preferences"
 
 
 @router.get(
@@ -39,49 +42,52 @@ def get_agent_service() -> AgentService:
     summary="Get Agent State",
     description="Get the current state of any agent type",
     tags=["Agent"],
+    responses={404: {"description": _AGENT_NOT_FOUND_DOC}},
 )
+@translate_errors(_AGENT_STATE_FAILED)
 async def get_agent_state(
     user_id: str,
+    service: AgentServiceDep,
     agent_type: AgentType = AgentType.MEMORY,
-    service: AgentService = Depends(get_agent_service),
 ):
     """Get agent state information."""
-    try:
-        state_data = service.get_agent_state(user_id=user_id)
-        return AgentStateResponse(**state_data)
-
-    except Exception as e:
-        logger.error(f"Agent state error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get agent state: {e!s}",
-        ) from e
+    # Built server-side from the live agent, so serialize the dict directly
+    # instead of validating it against response_model
+    return ORJSONResponse(content=await service.aget_agent_state(user_id=user_id))
 
 
 @router.get(
     "/agent/history/{user_id}",
     response_model=ConversationHistoryResponse,
     summary="Get Conversation History",
-    description="Get the conversation history for a user",
+    description="Get a page of the conversation history for a user",
     tags=["Agent"],
+    responses={404: {"description": _AGENT_NOT_FOUND_DOC}},
 )
+@translate_errors(_HISTORY_FAILED)
 async def get_conversation_history(
-    user_id: str, service: AgentService = Depends(get_agent_service)
+    user_id: str,
+    service: AgentServiceDep,
+    cursor: Annotated[int, Query(ge=0, description="Index of the first message")] = 0,
+    limit: Annotated[int, Query(ge=1, le=200, description="Page size")] = 50,
 ):
-    """Get conversation history."""
-    try:
-        messages = service.get_conversation_history(user_id=user_id)
-
-        return ConversationHistoryResponse(
-            user_id=user_id, session_id=None, messages=messages, count=len(messages)
-        )
-
-    except Exception as e:
-        logger.error(f"Conversation history error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get conversation history: {e!s}",
-        ) from e
+    """Get a page of conversation history."""
+    page = await service.aget_conversation_history_page(
+        user_id=user_id, offset=cursor, limit=limit
+    )
+
+    # Messages come straight from the agent; serialize the page directly
+    # instead of validating every message against response_model
+    return ORJSONResponse(
+        content={
+            "user_id": user_id,
+            "session_id": None,
+            "messages": page["messages"],
+            "count": len(page["messages"]),
+            "next_cursor": page["next_cursor"],
+            "has_more": page["has_more"],
+        }
+    )
 
 
 @router.post(
@@ -90,51 +96,46 @@ async def get_conversation_history(
     description="Reset all agents for a user",
     tags=["Agent"],
 )
-async def reset_agent(user_id: str, service: AgentService = Depends(get_agent_service)):
+@translate_errors(_RESET_FAILED)
+async def reset_agent(user_id: str, service: AgentServiceDep):
     """Reset all agents for a user."""
-    try:
-        service.reset_agent(user_id=user_id)
+    await service.areset_agent(user_id=user_id)
 
-        return {
+    # orjson encodes the datetime natively; skip jsonable_encoder
+    return ORJSONResponse(
+        content={
             "success": True,
             "message": f"All agents reset for user {user_id}",
-            "timestamp": datetime.utcnow(),
+            "timestamp": datetime.now(UTC),
         }
-
-    except Exception as e:
-        logger.error(f"Agent reset error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to reset agent: {e!s}",
-        ) from e
+    )
 
 
 @router.post(
     "/preferences/initialize",
     response_model=MemoryStoreResponse,
+    openapi_extra=json_body_openapi(InitializePreferencesRequest),
     summary="Initialize Preferences",
     description="Initialize user preferences in memory",
     tags=["Agent"],
 )
+@translate_errors(_PREFERENCES_FAILED)
 async def initialize_preferences(
-    request: InitializePreferencesRequest,
-    service: AgentService = Depends(get_agent_service),
+    request: Annotated[
+        InitializePreferencesRequest, Depends(json_body(InitializePreferencesRequest))
+    ],
+    service: AgentServiceDep,
 ):
     """Initialize user preferences."""
-    try:
-        result = service.initialize_user_preferences(
-            user_id=request.user_id, preferences=request.preferences
-        )
-
-        return MemoryStoreResponse(
-            success=result["success"],
-            message="User preferences initialized successfully",
-            memory_id=result.get("result", {}).get("id"),
-        )
-
-    except Exception as e:
-        logger.error(f"Preferences initialization error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to initialize preferences: {e!s}",
-        ) from e
+    result = await service.ainitialize_user_preferences(
+        user_id=request.user_id, preferences=request.preferences
+    )
+
+    # Serialize with the model's compiled serializer in one call; returning a
+    # Response skips FastAPI's response_model validation pass
+    response = MemoryStoreResponse.model_construct(
+        success=result["success"],
+        message="User preferences initialized successfully",
+        memory_id=result.get("result", {}).get("id"),
+    )
+    return Response(content=response.model_dump_json(), media_type="application/json")
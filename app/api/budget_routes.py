@@ -7,29 +7,28 @@ and sample data generation for financial analysis.
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 
-from ..models.schemas import (
+from ..models import (
     BudgetCalculationRequest,
     BudgetCalculationResponse,
     ChartRequest,
     ChartResponse,
     SampleDataResponse,
 )
-from ..services.agent_service import AgentService
+from .dependencies import AgentServiceDep
+from .errors import translate_errors
 
 logger = logging.getLogger(__name__)
 
 # Create API router
 router = APIRouter()
 
-# Global service instance
-agent_service = AgentService()
-
-
-def get_agent_service() -> AgentService:
-    """Dependency to get the agent service instance."""
-    return agent_service
+# Error details returned to clients; exception specifics are only logged
+_BUDGET_FAILED = "Budget calculation failed"
+_CHART_FAILED = "Chart creation failed"
+_SAMPLE_DATA_FAILED = "Sample data generation failed"
 
 
 @router.post(
@@ -39,21 +38,16 @@ def get_agent_service() -> AgentService:
     description="Calculate 50/30/20 budget breakdown",
     tags=["Budget"],
 )
+@translate_errors(_BUDGET_FAILED)
 async def calculate_budget(
     request: BudgetCalculationRequest,
-    service: AgentService = Depends(get_agent_service),
+    service: AgentServiceDep,
 ):
     """Calculate budget breakdown."""
-    try:
-        result = service.calculate_50_30_20_budget(request.monthly_income)
-        return BudgetCalculationResponse(**result)
-
-    except Exception as e:
-        logger.error(f"Budget calculation error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Budget calculation failed: {e!s}",
-        ) from e
+    # Trusted server-computed split; serialize without response_model validation
+    return ORJSONResponse(
+        content=service.calculate_50_30_20_budget(request.monthly_income)
+    )
 
 
 @router.post(
@@ -63,20 +57,16 @@ async def calculate_budget(
     description="Prepare data for client-side chart visualization",
     tags=["Budget"],
 )
-async def create_chart(
-    request: ChartRequest, service: AgentService = Depends(get_agent_service)
-):
+@translate_errors(_CHART_FAILED)
+async def create_chart(request: ChartRequest, service: AgentServiceDep):
     """Prepare chart data for client-side visualization."""
-    try:
-        result = service.create_chart_data(request.data, request.title)
-        return ChartResponse(**result)
-
-    except Exception as e:
-        logger.error(f"Chart creation error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Chart creation failed: {e!s}",
-        ) from e
+    result = service.create_chart_data(request.data, request.title)
+    # Serialize with the model's compiled serializer in one call; returning a
+    # Response skips FastAPI's response_model validation pass
+    return Response(
+        content=ChartResponse.model_construct(**result).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -86,15 +76,8 @@ async def create_chart(
     description="Generate sample spending data",
     tags=["Budget"],
 )
-async def generate_sample_data(service: AgentService = Depends(get_agent_service)):
+@translate_errors(_SAMPLE_DATA_FAILED)
+async def generate_sample_data(service: AgentServiceDep):
     """Generate sample spending data."""
-    try:
-        result = service.generate_sample_spending_data()
-        return SampleDataResponse(**result)
-
-    except Exception as e:
-        logger.error(f"Sample data generation error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Sample data generation failed: {e!s}",
-        ) from e
+    # Memoized per month by the service; skip response model re-validation
+    return ORJSONResponse(content=service.generate_sample_spending_data())
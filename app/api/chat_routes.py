@@ -5,39 +5,52 @@ This module contains endpoints for chatting with different types of agents
 including basic, financial, memory, budget, and orchestrator agents.
 """
 
-from functools import lru_cache
+from collections.abc import AsyncIterator
 import logging
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from ..config.settings import get_settings
-from ..models.schemas import ChatRequest, ChatResponse
+from ..models import ChatRequest, ChatResponse
 from ..services.agent_manager import AgentType
-from ..services.agent_service import AgentService
+from .body import json_body, json_body_openapi
+from .dependencies import AgentServiceDep
+from .errors import translate_errors
 
 logger = logging.getLogger(__name__)
 
 # Create API router
 router = APIRouter()
 
+# Error details returned to clients; exception specifics are only logged
+_CHAT_FAILED = "Chat failed"
 
-@lru_cache
-def get_agent_service() -> AgentService:
-    """Dependency to get the agent service instance."""
-    return AgentService()
+# Final chunk of a chat stream that failed after the response started
+_STREAM_ERROR_CHUNK = f"\n[ERROR] {_CHAT_FAILED}\n"
+
+# Resolved once at import; settings are cached for the process lifetime
+_DEFAULT_USER_ID = get_settings().default_user_id
 
 
 @router.post(
     "/chat",
     response_model=ChatResponse,
+    openapi_extra=json_body_openapi(ChatRequest),
     summary="Chat with Agent",
     description="Send a message to any type of agent",
     tags=["Chat"],
 )
+@translate_errors(_CHAT_FAILED)
 async def chat_with_agent(
-    request: ChatRequest,
-    service: AgentService = Depends(get_agent_service),
+    request: Annotated[ChatRequest, Depends(json_body(ChatRequest))],
+    service: AgentServiceDep,
     agent_type: AgentType = AgentType.MEMORY,
+    idempotency_key: Annotated[
+        str | None,
+        Header(description="Key identifying a turn; retries reuse its reply"),
+    ] = None,
 ):
     """
     Unified chat endpoint supporting multiple agent types.
@@ -50,26 +63,78 @@ async def chat_with_agent(
     - orchestrator: Multi-agent portfolio coordinator
 
     Uses AgentType.MEMORY as default agent type.
+
+    A client that may retry a turn sends an Idempotency-Key header; a retry
+    with the same key and message within the chat cache TTL returns the
+    original reply instead of running the turn again.
     """
+    # Use default user_id if not provided
+    user_id = request.user_id or _DEFAULT_USER_ID
+
+    logger.info("Chat request - User: %s, Agent: %s", user_id, agent_type)
+
+    result = await service.achat(
+        user_id=user_id,
+        message=request.message,
+        agent_type=agent_type,
+        session_id=request.session_id,
+        idempotency_key=idempotency_key,
+    )
+
+    # Built by AgentManager from a validated ChatResponse, so serialize the
+    # trusted dict directly instead of re-validating it against response_model
+    return ORJSONResponse(content=result)
+
+
+@router.post(
+    "/chat/stream",
+    response_class=StreamingResponse,
+    openapi_extra=json_body_openapi(ChatRequest),
+    summary="Stream Chat with Agent",
+    description="Send a message to any type of agent and stream the response",
+    tags=["Chat"],
+)
+async def stream_chat_with_agent(
+    request: Annotated[ChatRequest, Depends(json_body(ChatRequest))],
+    service: AgentServiceDep,
+    agent_type: AgentType = AgentType.MEMORY,
+):
+    """
+    Streaming variant of the chat endpoint.
+
+    Response text is sent as plain-text chunks while the model generates it,
+    so memory tool calls and inference overlap with delivery to the client
+    instead of the full response being buffered first.
+
+    Streamed turns bypass the chat cache: they are neither answered from
+    nor stored in it, and an Idempotency-Key header is ignored.
+
+    The status code is sent before generation starts, so a failure while
+    streaming ends the response with a final "[ERROR] Chat failed" line
+    instead of dropping the connection.
+    """
+    user_id = request.user_id or _DEFAULT_USER_ID
+
+    logger.info("Chat stream request - User: %s, Agent: %s", user_id, agent_type)
+
+    return StreamingResponse(
+        _with_error_chunk(
+            service.stream_chat(
+                user_id=user_id,
+                message=request.message,
+                agent_type=agent_type,
+                session_id=request.session_id,
+            )
+        ),
+        media_type="text/plain; charset=utf-8",
+    )
+
+
+async def _with_error_chunk(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Relay stream chunks, ending with an error chunk if the stream fails."""
     try:
-        # Use default user_id if not provided
-        settings = get_settings()
-        user_id = request.user_id or settings.default_user_id
-
-        logger.info(f"Chat request - User: {user_id}, Agent: {agent_type}")
-
-        result = service.chat(
-            user_id=user_id,
-            message=request.message,
-            agent_type=agent_type,
-            session_id=request.session_id,
-        )
-
-        return ChatResponse(**result)
-
-    except Exception as e:
-        logger.error(f"Chat error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Chat failed: {e!s}",
-        ) from e
+        async for chunk in chunks:
+            yield chunk
+    except Exception:
+        logger.exception(_CHAT_FAILED)
+        yield _STREAM_ERROR_CHUNK
@@ -0,0 +1,28 @@
+"""
+Shared FastAPI dependencies for the route modules.
+
+Declaring the dependency once as an ``Annotated`` alias means every route
+resolves the same callable, so FastAPI's per-request dependency cache is
+shared across routers.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from ..services.agent_service import AgentService
+
+
+async def _agent_service(request: Request) -> AgentService:
+    """
+    Return the AgentService created by the application lifespan.
+
+    Defined ``async`` so FastAPI calls it inline on the event loop rather than
+    dispatching a sync provider to the threadpool on every request.
+    """
+    return request.app.state.agent_service
+
+
+AgentServiceDep = Annotated[AgentService, Depends(_agent_service)]
+
+__all__ = ["AgentServiceDep"]
@@ -0,0 +1,62 @@
+"""
+Error translation for route handlers.
+
+This module maps service-layer exceptions to HTTP errors in one place, so
+route handlers only contain the happy path. Error details returned to
+clients are constants; exception specifics are only logged.
+"""
+
+from collections.abc import Awaitable, Callable
+from functools import wraps
+import logging
+from typing import Any
+
+from fastapi import HTTPException, status
+
+from ..services.agent_service import AgentNotFoundError
+
+# Error details for failures that are not specific to one endpoint
+_AGENT_NOT_FOUND = "No active agent for user"
+
+
+def translate_errors(
+    detail: str,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Translate exceptions raised by an async route handler into HTTP errors.
+
+    HTTPExceptions pass through unchanged, AgentNotFoundError becomes a 404
+    without a logged traceback, and anything else is logged against the
+    handler's module logger and returned as a 500 with ``detail``.
+
+    Args:
+        detail: Error detail returned to clients on internal errors
+
+    Returns:
+        Decorator applied beneath the router decorator
+    """
+
+    def decorator(
+        handler: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[Any]]:
+        logger = logging.getLogger(handler.__module__)
+
+        @wraps(handler)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await handler(*args, **kwargs)
+            except HTTPException:
+                raise
+            except AgentNotFoundError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail=_AGENT_NOT_FOUND
+                ) from e
+            except Exception as e:
+                logger.exception(detail)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=detail
+                ) from e
+
+        return wrapper
+
+    return decorator
@@ -6,102 +6,113 @@ using the mem0.io long-term memory system.
 """
 
 import logging
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 
-from ..models.schemas import (
-    Memory,
+from ..models import (
+    MemoryListRequest,
     MemoryListResponse,
+    MemoryRequest,
     MemoryRetrieveRequest,
     MemoryRetrieveResponse,
     MemoryStoreRequest,
     MemoryStoreResponse,
 )
-from ..services.agent_service import AgentService
+from .body import json_body, json_body_openapi
+from .dependencies import AgentServiceDep
+from .errors import translate_errors
 
 logger = logging.getLogger(__name__)
 
 # Create API router
 router = APIRouter()
 
-# Global service instance
-agent_service = AgentService()
+# Error details returned to clients; exception specifics are only logged
+_STORE_FAILED = "Memory storage failed"
+_RETRIEVE_FAILED = "Memory retrieval failed"
+_LIST_FAILED = "Memory listing failed"
 
 
-def get_agent_service() -> AgentService:
-    """Dependency to get the agent service instance."""
-    return agent_service
+def _to_memory_payloads(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Map mem0 records to the Memory response shape as plain dicts.
+
+    The memory endpoints return these directly in an ORJSONResponse, skipping
+    per-item Memory model construction and response_model re-validation.
+    """
+    return [
+        {
+            "id": mem.get("id"),
+            "content": mem.get("memory"),
+            "score": mem.get("score"),
+            "metadata": mem.get("metadata"),
+        }
+        for mem in results
+    ]
 
 
 @router.post(
     "/memory/store",
     response_model=MemoryStoreResponse,
+    openapi_extra=json_body_openapi(MemoryStoreRequest),
     summary="Store Memory",
     description="Store information in long-term memory",
     tags=["Memory"],
 )
+@translate_errors(_STORE_FAILED)
 async def store_memory(
-    request: MemoryStoreRequest, service: AgentService = Depends(get_agent_service)
+    request: Annotated[MemoryStoreRequest, Depends(json_body(MemoryStoreRequest))],
+    service: AgentServiceDep,
 ):
     """Store information in long-term memory."""
-    try:
-        result = service.store_memory(user_id=request.user_id, content=request.content)
-
-        return MemoryStoreResponse(
-            success=result["success"],
-            message=result["message"],
-            memory_id=result.get("result", {}).get("id"),
-        )
+    result = await service.astore_memory(
+        user_id=request.user_id, content=request.content
+    )
 
-    except Exception as e:
-        logger.error(f"Memory storage error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Memory storage failed: {e!s}",
-        ) from e
+    # Serialize with the model's compiled serializer in one call; returning a
+    # Response skips FastAPI's response_model validation pass
+    response = MemoryStoreResponse.model_construct(
+        success=result["success"],
+        message=result["message"],
+        memory_id=result.get("result", {}).get("id"),
+    )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.post(
     "/memory/retrieve",
     response_model=MemoryRetrieveResponse,
+    openapi_extra=json_body_openapi(MemoryRetrieveRequest),
     summary="Retrieve Memories",
     description="Retrieve relevant memories using semantic search",
     tags=["Memory"],
 )
+@translate_errors(_RETRIEVE_FAILED)
 async def retrieve_memories(
-    request: MemoryRetrieveRequest, service: AgentService = Depends(get_agent_service)
+    request: Annotated[
+        MemoryRetrieveRequest, Depends(json_body(MemoryRetrieveRequest))
+    ],
+    service: AgentServiceDep,
 ):
     """Retrieve memories using semantic search."""
-    try:
-        memories_data = service.retrieve_memories(
-            user_id=request.user_id,
-            query=request.query,
-            min_score=request.min_score,
-            max_results=request.max_results,
-        )
-
-        memories = [
-            Memory(
-                id=mem.get("id"),
-                content=mem.get("memory"),
-                score=mem.get("score"),
-                metadata=mem.get("metadata"),
-            )
-            for mem in memories_data.get("results", [])
-        ]
-
-        return MemoryRetrieveResponse(
-            success=memories_data.get("success", False),
-            memories=memories,
-            count=len(memories),
-        )
-
-    except Exception as e:
-        logger.error(f"Memory retrieval error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Memory retrieval failed: {e!s}",
-        ) from e
+    memories_data = await service.aretrieve_memories(
+        user_id=request.user_id,
+        query=request.query,
+        min_score=request.min_score,
+        max_results=request.max_results,
+    )
+
+    memories = _to_memory_payloads(memories_data.get("results", []))
+
+    return ORJSONResponse(
+        content={
+            "success": memories_data.get("success", False),
+            "memories": memories,
+            "count": len(memories),
+        }
+    )
 
 
 @router.get(
@@ -111,33 +122,41 @@ async def retrieve_memories(
     description="List all stored memories for a user",
     tags=["Memory"],
 )
-async def list_memories(
-    user_id: str, service: AgentService = Depends(get_agent_service)
-):
+@translate_errors(_LIST_FAILED)
+async def list_memories(user_id: str, service: AgentServiceDep):
     """List all memories for a user."""
-    try:
-        memories_data = service.list_all_memories(user_id=user_id)
-
-        memories = [
-            Memory(
-                id=mem.get("id"),
-                content=mem.get("memory"),
-                score=mem.get("score"),
-                metadata=mem.get("metadata"),
-            )
-            for mem in memories_data.get("results", [])
-        ]
-
-        return MemoryListResponse(
-            success=memories_data.get("success", False),
-            memories=memories,
-            count=len(memories),
-            user_id=user_id,
-        )
-
-    except Exception as e:
-        logger.error(f"Memory listing error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Memory listing failed: {e!s}",
-        ) from e
+    memories_data = await service.alist_all_memories(user_id=user_id)
+
+    memories = _to_memory_payloads(memories_data.get("results", []))
+
+    return ORJSONResponse(
+        content={
+            "success": memories_data.get("success", False),
+            "memories": memories,
+            "count": len(memories),
+            "user_id": user_id,
+        }
+    )
+
+
+@router.post(
+    "/memory",
+    response_model=MemoryStoreResponse | MemoryRetrieveResponse | MemoryListResponse,
+    summary="Memory Operation",
+    description="Store, retrieve or list memories, selected by the action field",
+    tags=["Memory"],
+)
+async def memory_operation(request: MemoryRequest, service: AgentServiceDep):
+    """
+    Run any memory operation from a single endpoint.
+
+    The body is validated as a discriminated union, so pydantic-core picks
+    the request model from the action tag instead of trying each in turn.
+    """
+    match request:
+        case MemoryStoreRequest():
+            return await store_memory(request, service)
+        case MemoryRetrieveRequest():
+            return await retrieve_memories(request, service)
+        case MemoryListRequest():
+            return await list_memories(request.user_id, service)
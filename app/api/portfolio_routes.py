@@ -6,47 +6,85 @@ and cache management for multi-agent portfolio workflows.
 """
 
 import logging
+from typing import Annotated
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Response,
+    status,
+)
+from fastapi.responses import ORJSONResponse
+import orjson
 
-from fastapi import APIRouter, Depends, HTTPException, status
-
-from ..services.agent_service import AgentService
+from ..models.portfolio_schemas import PortfolioOrchestrationRequest
+from .body import json_body, json_body_openapi
+from .dependencies import AgentServiceDep
+from .errors import translate_errors
 
 logger = logging.getLogger(__name__)
 
 # Create API router
 router = APIRouter()
 
-# Global service instance
-agent_service = AgentService()
+# Error details returned to clients; exception specifics are only logged
+_ORCHESTRATION_FAILED = "Portfolio orchestration failed"
+_PORTFOLIO_DATA_FAILED = "Failed to get portfolio data"
+_CLEAR_CACHE_FAILED = "Failed to clear cache"
+_JOB_NOT_FOUND = "Portfolio job not found"
 
-
-def get_agent_service() -> AgentService:
-    """Dependency to get the agent service instance."""
-    return agent_service
+# Constant response body, serialized once
+_CLEAR_CACHE_BODY = orjson.dumps(
+    {"success": True, "message": "All cache cleared successfully"}
+)
 
 
 @router.post(
     "/portfolio/orchestrate",
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=json_body_openapi(PortfolioOrchestrationRequest),
     summary="Run Portfolio Orchestration",
-    description="Run complete multi-agent portfolio workflow",
+    description="Start the multi-agent portfolio workflow as a background job",
     tags=["Portfolio"],
 )
+@translate_errors(_ORCHESTRATION_FAILED)
 async def orchestrate_portfolio(
-    request: dict, service: AgentService = Depends(get_agent_service)
+    request: Annotated[
+        PortfolioOrchestrationRequest, Depends(json_body(PortfolioOrchestrationRequest))
+    ],
+    service: AgentServiceDep,
+    background_tasks: BackgroundTasks,
 ):
-    """Run portfolio orchestration."""
-    try:
-        user_request = request.get("request", "Create an optimal investment portfolio")
-        result = service.orchestrate_portfolio(user_request)
+    """
+    Start portfolio orchestration.
 
-        return result
+    Returns immediately with a job ID; poll /portfolio/jobs/{job_id} or
+    /portfolio/data for the result.
+    """
+    user_request = request.request
+    job_id = service.start_portfolio_job(user_request)
+    background_tasks.add_task(service.run_portfolio_job, job_id, user_request)
 
-    except Exception as e:
-        logger.error(f"Portfolio orchestration error: {e!s}")
+    return {"job_id": job_id, "status": "accepted"}
+
+
+@router.get(
+    "/portfolio/jobs/{job_id}",
+    summary="Get Portfolio Job",
+    description="Get the status and result of a portfolio orchestration job",
+    tags=["Portfolio"],
+)
+async def get_portfolio_job(job_id: str, service: AgentServiceDep):
+    """Get a portfolio orchestration job."""
+    job = service.get_portfolio_job(job_id)
+    if job is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Portfolio orchestration failed: {e!s}",
-        ) from e
+            status_code=status.HTTP_404_NOT_FOUND, detail=_JOB_NOT_FOUND
+        )
+
+    return job
 
 
 @router.get(
@@ -55,18 +93,10 @@ async def orchestrate_portfolio(
     description="Retrieve all cached portfolio data",
     tags=["Portfolio"],
 )
-async def get_portfolio_data(service: AgentService = Depends(get_agent_service)):
+@translate_errors(_PORTFOLIO_DATA_FAILED)
+async def get_portfolio_data(service: AgentServiceDep):
     """Get cached portfolio data."""
-    try:
-        portfolios = service.get_cached_portfolios()
-        return {"success": True, "portfolios": portfolios, "count": len(portfolios)}
-
-    except Exception as e:
-        logger.error(f"Portfolio data retrieval error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get portfolio data: {e!s}",
-        ) from e
+    return ORJSONResponse(content=service.get_portfolio_data())
 
 
 @router.delete(
@@ -75,15 +105,8 @@ async def get_portfolio_data(service: AgentService = Depends(get_agent_service))
     description="Clear all cached portfolio and visualization data",
     tags=["Portfolio"],
 )
-async def clear_cache(service: AgentService = Depends(get_agent_service)):
+@translate_errors(_CLEAR_CACHE_FAILED)
+async def clear_cache(service: AgentServiceDep):
     """Clear all cached data."""
-    try:
-        service.clear_cache()
-        return {"success": True, "message": "All cache cleared successfully"}
-
-    except Exception as e:
-        logger.error(f"Cache clearing error: {e!s}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to clear cache: {e!s}",
-        ) from e
+    service.clear_cache()
+    return Response(content=_CLEAR_CACHE_BODY, media_type="application/json")
@@ -5,19 +5,89 @@ This module contains system-level endpoints for health checks,
 API information, and system status.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
+import hashlib
 import logging
+import time
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import ORJSONResponse
+import orjson
 
 from ..config.settings import get_settings
-from ..models.schemas import HealthResponse
+from ..models import HealthResponse
 
 logger = logging.getLogger(__name__)
 
 # Create API router
 router = APIRouter()
 
+# Settings are cached for the process lifetime, so the static parts of the
+# system responses are built once at import
+_SETTINGS = get_settings()
+
+_HEALTH_TEMPLATE = {
+    "status": "healthy",
+    "app_name": _SETTINGS.app_name,
+    "version": _SETTINGS.app_version,
+}
+
+_API_INFO = {
+    "message": f"Welcome to {_SETTINGS.app_name} API",
+    "version": _SETTINGS.app_version,
+    "description": "Strands Agents API - Comprehensive agent management with memory, budget analysis, and portfolio orchestration",
+    "status": "healthy",
+    "endpoints": {
+        "chat": "/chat",
+        "memory": {
+            "store": "/memory/store",
+            "retrieve": "/memory/retrieve",
+            "list": "/memory/list/{user_id}",
+            "operation": "/memory",
+        },
+        "agent": {
+            "state": "/agent/state/{user_id}",
+            "history": "/agent/history/{user_id}",
+            "reset": "/agent/reset/{user_id}",
+        },
+        "budget": {
+            "calculate": "/budget/calculate",
+            "chart": "/budget/chart",
+            "sample_data": "/budget/sample-data",
+        },
+        "portfolio": {
+            "orchestrate": "/portfolio/orchestrate",
+            "jobs": "/portfolio/jobs/{job_id}",
+            "data": "/portfolio/data",
+            "cache": "/portfolio/cache",
+        },
+        "preferences": "/preferences/initialize",
+        "health_check": "/health",
+    },
+    "documentation": "/docs",
+}
+
+# Pre-serialized API info with a strong validator for conditional requests
+_API_INFO_BYTES = orjson.dumps(_API_INFO)
+_API_INFO_ETAG = f'"{hashlib.md5(_API_INFO_BYTES, usedforsecurity=False).hexdigest()}"'
+_API_INFO_HEADERS = {"ETag": _API_INFO_ETAG, "Cache-Control": "public, max-age=60"}
+
+# Let intermediaries answer repeated probes within the same second
+_HEALTH_HEADERS = {"Cache-Control": "public, max-age=1"}
+
+# (epoch second, ISO-8601 string) of the last formatted health timestamp
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ISO-8601, formatted at most once a second."""
+    global _timestamp_cache
+
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now, UTC).isoformat())
+    return _timestamp_cache[1]
+
 
 @router.get(
     "/health",
@@ -28,12 +98,9 @@ router = APIRouter()
 )
 async def health_check():
     """Health check endpoint."""
-    settings = get_settings()
-    return HealthResponse(
-        status="healthy",
-        app_name=settings.app_name,
-        version=settings.app_version,
-        timestamp=datetime.utcnow(),
+    return ORJSONResponse(
+        content={**_HEALTH_TEMPLATE, "timestamp": _utc_timestamp()},
+        headers=_HEALTH_HEADERS,
     )
 
 
@@ -43,39 +110,21 @@ async def health_check():
     summary="API Information",
     description="Get comprehensive API information and capabilities",
 )
-async def api_info():
-    """Root endpoint with comprehensive API information."""
-    settings = get_settings()
-
-    return {
-        "message": f"Welcome to {settings.app_name} API",
-        "version": settings.app_version,
-        "description": "Strands Agents API - Comprehensive agent management with memory, budget analysis, and portfolio orchestration",
-        "status": "healthy",
-        "endpoints": {
-            "chat": "/chat",
-            "memory": {
-                "store": "/memory/store",
-                "retrieve": "/memory/retrieve",
-                "list": "/memory/list/{user_id}",
-            },
-            "agent": {
-                "state": "/agent/state/{user_id}",
-                "history": "/agent/history/{user_id}",
-                "reset": "/agent/reset/{user_id}",
-            },
-            "budget": {
-                "calculate": "/budget/calculate",
-                "chart": "/budget/chart",
-                "sample_data": "/budget/sample-data",
-            },
-            "portfolio": {
-                "orchestrate": "/portfolio/orchestrate",
-                "data": "/portfolio/data",
-                "cache": "/portfolio/cache",
-            },
-            "preferences": "/preferences/initialize",
-            "health_check": "/health",
-        },
-        "documentation": "/docs",
-    }
+async def api_info(request: Request):
+    """
+    Root endpoint with comprehensive API information.
+
+    The body only changes with the deployed settings, so it is served with
+    an ETag and answered with 304 Not Modified when the client already has it.
+    """
+    if_none_match = request.headers.get("if-none-match", "")
+    if _API_INFO_ETAG in if_none_match or if_none_match.strip() == "*":
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=_API_INFO_HEADERS
+        )
+
+    return Response(
+        content=_API_INFO_BYTES,
+        media_type="application/json",
+        headers=_API_INFO_HEADERS,
+    )
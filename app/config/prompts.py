@@ -67,7 +67,7 @@ spending patterns, create budgets, and visualize financial data.
 
 Capabilities:
 - Analyze spending categories
-- Calculate 50/30/20 budget breakdowns
+- Calculate 50/30/20 budget breakdowns, for one income or several at once
 - Generate financial charts
 - Provide optimization suggestions
 
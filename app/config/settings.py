@@ -23,6 +23,11 @@ class Settings(BaseSettings):
     debug: bool = False
     host: str = "0.0.0.0"
     port: int = 8000
+    # Log file path; empty disables file logging
+    log_file: str | None = "app.log"
+
+    # Worker threadpool size for sync (def) endpoints and blocking service calls
+    threadpool_size: int = 200
 
     # Google Gemini Model Configuration
     # Using Gemini models for AI processing
@@ -41,11 +46,34 @@ class Settings(BaseSettings):
     # Mem0 Platform Configuration (optional)
     mem0_api_key: str | None = None
 
+    # Memory Retrieval Cache
+    # TTLs in seconds for cached mem0 search and list results
+    memory_cache_size: int = 1024
+    memory_cache_ttl: int = 300
+    memory_list_cache_ttl: int = 900
+
     # Conversation Management
     # SlidingWindowConversationManager settings
     conversation_window_size: int = 10
     conversation_min_messages: int = 2
 
+    # Agent Cache
+    # Maximum number of agent instances kept; least recently used are evicted
+    max_cached_agents: int = 1000
+
+    # Chat Response Cache
+    # Replies to turns sent with an Idempotency-Key header are kept for the
+    # TTL (seconds), so client retries get the original reply
+    chat_cache_size: int = 1024
+    chat_cache_ttl: int = 60
+
+    # Portfolio Orchestration
+    # Jobs kept at most; finished jobs expire after the TTL (seconds)
+    portfolio_job_cache_size: int = 1000
+    portfolio_job_ttl: int = 3600
+    # TTL in seconds for the cached /portfolio/data payload
+    portfolio_data_cache_ttl: int = 300
+
     # User Session Configuration
     default_user_id: str = "default_user"
 
@@ -18,21 +18,35 @@ https://github.com/strands-agents/samples/blob/main/02-samples/11-personal-finan
 """
 
 from contextlib import asynccontextmanager
+from functools import cache
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 import time
 
-from fastapi import FastAPI, Request, status
+from anyio import to_thread
+from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import HTMLResponse, ORJSONResponse
+import orjson
 
 from .api import router
 from .config.settings import get_settings
+from .services.container import get_agent_service
 
 # Configure logging
+# Records are formatted by the QueueHandler and written by a background
+# listener thread, so request handling never blocks on console or file I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handlers: list[logging.Handler] = [logging.StreamHandler()]
+if log_file := get_settings().log_file:
+    _log_handlers.append(logging.FileHandler(log_file))
+_log_listener = QueueListener(_log_queue, *_log_handlers)
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(), logging.FileHandler("app.log")],
+    handlers=[QueueHandler(_log_queue)],
 )
 logger = logging.getLogger(__name__)
 
@@ -46,9 +60,29 @@ async def lifespan(app: FastAPI):
     - Startup: Initialize resources, log application start
     - Shutdown: Cleanup resources, log application shutdown
     """
+    _log_listener.start()
+
+    # Sync endpoints and blocking service calls run in anyio's threadpool;
+    # raise its default limit of 40
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
+    # Routes read the shared service from app.state instead of calling the
+    # provider on every request
+    app.state.agent_service = get_agent_service()
+
+    # Pay agent and local tool setup costs off the request path; heavy tool
+    # modules (strands_tools, mem0) still load on first use
+    await to_thread.run_sync(app.state.agent_service.agent_manager.warmup)
+
+    # Build and serialize the OpenAPI schema, and with it every route model's
+    # JSON schema, before serving so no /docs or /openapi.json hit pays for it
+    _openapi_bytes()
 
     yield
 
+    # Flush queued log records before the process exits
+    _log_listener.stop()
+
 
 # Initialize FastAPI application
 settings = get_settings()
@@ -110,9 +144,11 @@ app = FastAPI(
     """,
     version=settings.app_version,
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
+    # Served by the routes below from a pre-serialized schema
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
 )
 
 
@@ -126,9 +162,9 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
     Returns a structured error response with validation details.
     """
-    logger.error(f"Validation error: {exc.errors()}")
+    logger.error("Validation error: %s", exc.errors())
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "ValidationError",
@@ -146,9 +182,9 @@ async def global_exception_handler(request: Request, exc: Exception):
 
     Logs the error and returns a generic error response.
     """
-    logger.error(f"Unhandled exception: {exc!s}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "InternalServerError",
@@ -161,36 +197,93 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Request logging middleware
 
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
+class RequestLoggingMiddleware:
     """
     Log all incoming requests and their processing time.
+
+    Implemented as a pure ASGI middleware so responses are not buffered
+    through BaseHTTPMiddleware; the processing time header is injected
+    by wrapping ``send``. Health probes and the root endpoint are passed
+    straight through without timing or logging.
     """
 
-    # Log request
-    logger.info(f" {request.method} {request.url.path}")
+    # Paths hit by load balancer probes at high frequency
+    SKIP_PATHS = frozenset({"/", "/health", "/api/v1/health"})
 
-    # Process request and measure time
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
+    def __init__(self, app):
+        self.app = app
 
-    # Log response
-    logger.info(
-        f" {request.method} {request.url.path} "
-        f"[{response.status_code}] {process_time:.3f}s"
-    )
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+
+        # Log request
+        logger.debug(" %s %s", method, path)
+
+        # Process request and measure time
+        start_time = time.perf_counter_ns()
+        status_code = None
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = (time.perf_counter_ns() - start_time) / 1e9
+
+                # Add processing time header
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", str(process_time).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        process_time_ms = (time.perf_counter_ns() - start_time) / 1e6
 
-    # Add processing time header
-    response.headers["X-Process-Time"] = str(process_time)
+        # Log response
+        logger.info(" %s %s [%s] %.1fms", method, path, status_code, process_time_ms)
 
-    return response
+
+app.add_middleware(RequestLoggingMiddleware)
 
 
 # Include API routes
 app.include_router(router, prefix="/api/v1")
 
 
+# OpenAPI schema and interactive documentation
+OPENAPI_URL = "/openapi.json"
+
+
+@cache
+def _openapi_bytes() -> bytes:
+    """Serialize the OpenAPI schema once per process."""
+    return orjson.dumps(app.openapi())
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json() -> Response:
+    """Serve the pre-serialized OpenAPI schema."""
+    return Response(content=_openapi_bytes(), media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui_html() -> HTMLResponse:
+    """Serve the Swagger UI documentation."""
+    return get_swagger_ui_html(
+        openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI"
+    )
+
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc_html() -> HTMLResponse:
+    """Serve the ReDoc documentation."""
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
+
+
 # Root endpoint
 
 
@@ -257,4 +350,7 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level="info",
+        # uvloop/httptools ship with uvicorn[standard] via fastapi[standard]
+        loop="uvloop",
+        http="httptools",
     )
@@ -13,64 +13,115 @@ Domain modules:
     - portfolio_schemas: Portfolio-related models
 """
 
-# Base schemas (common models)
-# Agent schemas
-from .agent_schemas import (
-    AgentStateResponse,
-    ConversationHistoryResponse,
-    InitializePreferencesRequest,
-)
-from .base_schemas import (
-    ErrorResponse,
-    HealthResponse,
-    Memory,
-    MemoryAction,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-# Budget schemas
-from .budget_schemas import (
-    BudgetCalculationRequest,
-    BudgetCalculationResponse,
-    ChartRequest,
-    ChartResponse,
-    SampleDataResponse,
-)
+if TYPE_CHECKING:
+    from .agent_schemas import (
+        AgentStateResponse,
+        AgentStatus,
+        ConversationHistoryResponse,
+        ConversationMessage,
+        InitializePreferencesRequest,
+    )
+    from .base_schemas import ErrorResponse, HealthResponse, Memory, MemoryAction
+    from .budget_schemas import (
+        BudgetBucket,
+        BudgetCalculationRequest,
+        BudgetCalculationResponse,
+        ChartRequest,
+        ChartResponse,
+        SampleDataResponse,
+    )
+    from .chat_schemas import ChatMetadata, ChatRequest, ChatResponse
+    from .memory_schemas import (
+        MemoryListRequest,
+        MemoryListResponse,
+        MemoryRequest,
+        MemoryRetrieveRequest,
+        MemoryRetrieveResponse,
+        MemoryStoreRequest,
+        MemoryStoreResponse,
+    )
+    from .portfolio_schemas import PortfolioOrchestrationRequest
 
-# Chat schemas
-from .chat_schemas import (
-    ChatRequest,
-    ChatResponse,
-)
+# Domain module defining each exported model. Modules are imported on first
+# attribute access (PEP 562), so domains a process never touches never build
+# their schemas.
+_LAZY = {
+    # Agent schemas
+    "AgentStateResponse": "agent_schemas",
+    "AgentStatus": "agent_schemas",
+    "ConversationHistoryResponse": "agent_schemas",
+    "ConversationMessage": "agent_schemas",
+    "InitializePreferencesRequest": "agent_schemas",
+    # Base schemas (common models)
+    "ErrorResponse": "base_schemas",
+    "HealthResponse": "base_schemas",
+    "Memory": "base_schemas",
+    "MemoryAction": "base_schemas",
+    # Budget schemas
+    "BudgetBucket": "budget_schemas",
+    "BudgetCalculationRequest": "budget_schemas",
+    "BudgetCalculationResponse": "budget_schemas",
+    "ChartRequest": "budget_schemas",
+    "ChartResponse": "budget_schemas",
+    "SampleDataResponse": "budget_schemas",
+    # Chat schemas
+    "ChatMetadata": "chat_schemas",
+    "ChatRequest": "chat_schemas",
+    "ChatResponse": "chat_schemas",
+    # Memory schemas
+    "MemoryListRequest": "memory_schemas",
+    "MemoryListResponse": "memory_schemas",
+    "MemoryRequest": "memory_schemas",
+    "MemoryRetrieveRequest": "memory_schemas",
+    "MemoryRetrieveResponse": "memory_schemas",
+    "MemoryStoreRequest": "memory_schemas",
+    "MemoryStoreResponse": "memory_schemas",
+    # Portfolio schemas
+    "PortfolioOrchestrationRequest": "portfolio_schemas",
+}
 
-# Memory schemas
-from .memory_schemas import (
-    MemoryListResponse,
-    MemoryRetrieveRequest,
-    MemoryRetrieveResponse,
-    MemoryStoreRequest,
-    MemoryStoreResponse,
-)
 
-# Portfolio schemas
-from .portfolio_schemas import (
-    PortfolioOrchestrationRequest,
-)
+def __getattr__(name: str):
+    """Import an exported model from its domain module on first access."""
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported models alongside the module globals."""
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "AgentStateResponse",
+    "AgentStatus",
+    "BudgetBucket",
     "BudgetCalculationRequest",
     "BudgetCalculationResponse",
     "ChartRequest",
     "ChartResponse",
+    "ChatMetadata",
     "ChatRequest",
     "ChatResponse",
     "ConversationHistoryResponse",
+    "ConversationMessage",
     "ErrorResponse",
     "HealthResponse",
     "InitializePreferencesRequest",
     "Memory",
     "MemoryAction",
+    "MemoryListRequest",
     "MemoryListResponse",
+    "MemoryRequest",
     "MemoryRetrieveRequest",
     "MemoryRetrieveResponse",
     "MemoryStoreRequest",
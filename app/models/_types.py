@@ -0,0 +1,28 @@
+"""
+Shared constrained field types.
+
+This module contains reusable Annotated types for request fields, so each
+constraint is declared once and shared by every model that accepts that
+kind of text or amount.
+"""
+
+from typing import Annotated
+
+from pydantic import Field, StringConstraints
+
+# Chat message sent to an agent
+UserMessage = Annotated[
+    str, StringConstraints(min_length=1, max_length=5000, strip_whitespace=True)
+]
+
+# Content stored in long-term memory
+MemoryContent = Annotated[str, StringConstraints(min_length=1, max_length=10000)]
+
+# Free-text query or instruction; must not be empty
+NonEmptyText = Annotated[str, StringConstraints(min_length=1)]
+
+# Finite float; rejects NaN and infinity
+FiniteFloat = Annotated[float, Field(allow_inf_nan=False)]
+
+# Positive, finite monetary amount
+Money = Annotated[FiniteFloat, Field(gt=0)]
@@ -7,7 +7,37 @@ conversation history, and preference initialization.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AgentStatus(BaseModel):
+    """
+    Runtime status of an agent.
+
+    Attributes:
+        status: Agent status
+        model: Model provider backing the agent
+    """
+
+    status: str = Field(..., description="Agent status")
+    model: str = Field(..., description="Model provider")
+
+
+class ConversationMessage(BaseModel):
+    """
+    A single message in a conversation history.
+
+    Attributes:
+        role: Message author role
+        content: Message text or Strands content blocks
+        timestamp: Message timestamp, if recorded
+    """
+
+    role: str = Field(..., description="Message author role")
+    content: str | list[dict[str, Any]] = Field(
+        ..., description="Message text or content blocks"
+    )
+    timestamp: str = Field("", description="Message timestamp")
 
 
 class AgentStateResponse(BaseModel):
@@ -21,12 +51,17 @@ class AgentStateResponse(BaseModel):
         available_tools: List of available tool names
     """
 
+    # Built from trusted data; compile the validator and serializer on first use
+    model_config = ConfigDict(defer_build=True)
+
     agent_id: str = Field(..., description="Agent identifier")
     message_count: int = Field(
         ..., description="Number of messages in conversation", ge=0
     )
-    state: dict[str, Any] = Field(..., description="Current agent state")
-    available_tools: list[str] = Field(..., description="List of available tool names")
+    state: AgentStatus = Field(..., description="Current agent state")
+    available_tools: tuple[str, ...] = Field(
+        ..., description="List of available tool names"
+    )
 
 
 class InitializePreferencesRequest(BaseModel):
@@ -38,11 +73,21 @@ class InitializePreferencesRequest(BaseModel):
         preferences: User preferences text
     """
 
-    user_id: str = Field(..., description="User identifier", example="user_123")
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "user_id": "user_123",
+                    "preferences": "My name is Charlie. I prefer a 40-30-30 budget split...",
+                }
+            ]
+        }
+    )
+
+    user_id: str = Field(..., description="User identifier")
     preferences: str = Field(
         ...,
         description="User preferences and financial information",
-        example="My name is Charlie. I prefer a 40-30-30 budget split...",
     )
 
 
@@ -53,13 +98,20 @@ class ConversationHistoryResponse(BaseModel):
     Attributes:
         user_id: User identifier
         session_id: Session identifier
-        messages: List of messages in conversation
-        count: Number of messages
+        messages: Page of messages in conversation
+        count: Number of messages in this page
+        next_cursor: Cursor for the next page, if any
+        has_more: Whether more messages follow this page
     """
 
+    # Built from trusted data; compile the validator and serializer on first use
+    model_config = ConfigDict(defer_build=True)
+
     user_id: str = Field(..., description="User identifier")
     session_id: str | None = Field(None, description="Session identifier")
-    messages: list[dict[str, Any]] = Field(
+    messages: list[ConversationMessage] = Field(
         ..., description="List of conversation messages"
     )
-    count: int = Field(..., description="Number of messages", ge=0)
+    count: int = Field(..., description="Number of messages in this page", ge=0)
+    next_cursor: int | None = Field(None, description="Cursor for the next page")
+    has_more: bool = Field(False, description="Whether more messages follow")
@@ -5,15 +5,19 @@ This module contains foundational Pydantic models that are shared
 across different domains and API endpoints.
 """
 
-from datetime import datetime
-from enum import Enum
-from typing import Any
+from datetime import UTC, datetime
+from enum import StrEnum
+from functools import partial
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, JsonValue
 
+# Timezone-aware replacement for the deprecated datetime.utcnow; a partial
+# keeps the default factory a C-level call with no Python frame
+utc_now = partial(datetime.now, UTC)
 
-class MemoryAction(str, Enum):
-    """Enum for memory tool actions."""
+
+class MemoryAction(StrEnum):
+    """Memory operation tags; the discriminator of MemoryRequest."""
 
     STORE = "store"
     RETRIEVE = "retrieve"
@@ -31,10 +35,15 @@ class Memory(BaseModel):
         metadata: Additional memory metadata
     """
 
+    # Never mutated after construction
+    model_config = ConfigDict(frozen=True)
+
     id: str | None = Field(None, description="Memory identifier")
     content: str = Field(..., description="Memory content")
     score: float | None = Field(None, description="Relevance score", ge=0.0, le=1.0)
-    metadata: dict[str, Any] | None = Field(None, description="Additional metadata")
+    metadata: dict[str, JsonValue] | None = Field(
+        None, description="Additional metadata"
+    )
 
 
 class HealthResponse(BaseModel):
@@ -48,11 +57,27 @@ class HealthResponse(BaseModel):
         timestamp: Health check timestamp
     """
 
-    status: str = Field(..., description="Health status", example="healthy")
+    # Never mutated after construction; built from trusted data, so the
+    # validator and serializer are only compiled on first use
+    model_config = ConfigDict(
+        frozen=True,
+        defer_build=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "status": "healthy",
+                    "app_name": "Personal Finance Assistant",
+                    "version": "1.0.0",
+                }
+            ]
+        },
+    )
+
+    status: str = Field(..., description="Health status")
     app_name: str = Field(..., description="Application name")
     version: str = Field(..., description="Application version")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Health check timestamp"
+        default_factory=utc_now, description="Health check timestamp"
     )
 
 
@@ -67,11 +92,19 @@ class ErrorResponse(BaseModel):
         timestamp: Error timestamp
     """
 
-    error: str = Field(..., description="Error type or code", example="ValidationError")
-    message: str = Field(
-        ..., description="Error message", example="Invalid request parameters"
-    )
-    detail: Any | None = Field(None, description="Detailed error information")
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Error timestamp"
+    # Never mutated after construction; built from trusted data, so the
+    # validator and serializer are only compiled on first use
+    model_config = ConfigDict(
+        frozen=True,
+        defer_build=True,
+        json_schema_extra={
+            "examples": [
+                {"error": "ValidationError", "message": "Invalid request parameters"}
+            ]
+        },
     )
+
+    error: str = Field(..., description="Error type or code")
+    message: str = Field(..., description="Error message")
+    detail: JsonValue = Field(None, description="Detailed error information")
+    timestamp: datetime = Field(default_factory=utc_now, description="Error timestamp")
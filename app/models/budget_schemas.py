@@ -5,56 +5,85 @@ This module contains Pydantic models for budget calculations,
 financial analysis, and chart visualization.
 """
 
-from typing import Any
+from pydantic import BaseModel, ConfigDict, Field
 
-from pydantic import BaseModel, Field
+from ._types import FiniteFloat, Money
 
 
 class BudgetCalculationRequest(BaseModel):
     """Request model for budget calculation."""
 
-    monthly_income: float = Field(
-        ..., description="Monthly income amount", gt=0, example=5000.0
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [{"monthly_income": 5000.0}]}
     )
 
+    monthly_income: Money = Field(..., description="Monthly income amount")
+
+
+class BudgetBucket(BaseModel):
+    """
+    One bucket of a 50/30/20 budget.
+
+    Attributes:
+        amount: Amount allocated to the bucket
+        percentage: Share of income allocated to the bucket
+    """
+
+    amount: float = Field(..., description="Amount allocated")
+    percentage: float = Field(..., description="Share of income in percent")
+
 
 class BudgetCalculationResponse(BaseModel):
     """Response model for budget calculation."""
 
+    # Built from trusted data; compile the validator and serializer on first use
+    model_config = ConfigDict(defer_build=True)
+
     monthly_income: float = Field(..., description="Monthly income")
-    needs: dict[str, Any] = Field(..., description="50% for needs")
-    wants: dict[str, Any] = Field(..., description="30% for wants")
-    savings: dict[str, Any] = Field(..., description="20% for savings")
+    needs: BudgetBucket = Field(..., description="50% for needs")
+    wants: BudgetBucket = Field(..., description="30% for wants")
+    savings: BudgetBucket = Field(..., description="20% for savings")
     total: float = Field(..., description="Total income")
 
 
 class ChartRequest(BaseModel):
     """Request model for creating financial charts."""
 
-    data: dict[str, float] = Field(
-        ...,
-        description="Data to visualize",
-        example={"Category A": 100, "Category B": 200},
-    )
-    title: str = Field(
-        ..., description="Chart title", example="Monthly Spending Breakdown"
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "data": {"Category A": 100, "Category B": 200},
+                    "title": "Monthly Spending Breakdown",
+                }
+            ]
+        }
     )
 
+    data: dict[str, FiniteFloat] = Field(..., description="Data to visualize")
+    title: str = Field(..., description="Chart title")
+
 
 class ChartResponse(BaseModel):
     """Response model for chart data."""
 
+    # Built from trusted data; compile the validator and serializer on first use
+    model_config = ConfigDict(defer_build=True)
+
     title: str = Field(..., description="Chart title")
     data: dict[str, float] = Field(..., description="Data for visualization")
     chart_type: str = Field(default="pie", description="Recommended chart type")
-    labels: list[str] = Field(..., description="Labels for chart data")
-    values: list[float] = Field(..., description="Values for chart data")
+    labels: tuple[str, ...] = Field(..., description="Labels for chart data")
+    values: tuple[float, ...] = Field(..., description="Values for chart data")
 
 
 class SampleDataResponse(BaseModel):
     """Response for sample data generation."""
 
+    # Built from trusted data; compile the validator and serializer on first use
+    model_config = ConfigDict(defer_build=True)
+
     categories: dict[str, float] = Field(..., description="Spending by category")
-    total: float = Field(..., description="Total monthly spending")
+    total: FiniteFloat = Field(..., description="Total monthly spending")
     month: str = Field(..., description="Month and year")
     description: str = Field(..., description="Data description")
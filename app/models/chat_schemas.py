@@ -6,9 +6,11 @@ including request and response models.
 """
 
 from datetime import datetime
-from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._types import UserMessage
+from .base_schemas import utc_now
 
 
 class ChatRequest(BaseModel):
@@ -21,25 +23,44 @@ class ChatRequest(BaseModel):
         session_id: Optional session identifier for conversation tracking
     """
 
-    message: str = Field(
-        ...,
-        description="User's message or query",
-        min_length=1,
-        max_length=5000,
-        example="I want to save $800 per month and focus on reducing dining expenses",
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "message": "I want to save $800 per month and focus on reducing dining expenses",
+                    "user_id": "user_123",
+                    "session_id": "session_20250101120000",
+                }
+            ]
+        }
     )
+
+    message: UserMessage = Field(..., description="User's message or query")
     user_id: str | None = Field(
         None,
         description="Unique user identifier for memory persistence",
-        example="user_123",
     )
     session_id: str | None = Field(
         None,
         description="Session identifier for conversation tracking",
-        example="session_20250101120000",
     )
 
 
+class ChatMetadata(BaseModel):
+    """
+    Metadata about a chat response.
+
+    Attributes:
+        agent_type: Type of agent that produced the response
+
+    Further metadata keys are kept as extras without per-key validation.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    agent_type: str = Field(..., description="Agent type that responded")
+
+
 class ChatResponse(BaseModel):
     """
     Response model for chat endpoint.
@@ -60,8 +81,8 @@ class ChatResponse(BaseModel):
         ..., description="Number of messages in conversation history", ge=0
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Response timestamp"
+        default_factory=utc_now, description="Response timestamp"
     )
-    metadata: dict[str, Any] | None = Field(
+    metadata: ChatMetadata | None = Field(
         None, description="Additional response metadata"
     )
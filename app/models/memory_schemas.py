@@ -5,9 +5,12 @@ This module contains Pydantic models for memory operations
 including storage, retrieval, and listing functionality.
 """
 
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal
 
-from .base_schemas import Memory
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._types import MemoryContent, NonEmptyText
+from .base_schemas import Memory, MemoryAction
 
 
 class MemoryStoreRequest(BaseModel):
@@ -15,18 +18,27 @@ class MemoryStoreRequest(BaseModel):
     Request model for storing memories.
 
     Attributes:
+        action: Memory operation tag
         content: The content to store in memory
         user_id: User identifier for memory association
     """
 
-    content: str = Field(
-        ...,
-        description="Content to store in memory",
-        min_length=1,
-        max_length=10000,
-        example="My monthly budget is $4000. I prefer to save 30% and spend 20% on dining.",
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "content": "My monthly budget is $4000. I prefer to save 30% and spend 20% on dining.",
+                    "user_id": "user_123",
+                }
+            ]
+        }
+    )
+
+    action: Literal[MemoryAction.STORE] = Field(
+        MemoryAction.STORE, description="Memory operation tag"
     )
-    user_id: str = Field(..., description="User identifier", example="user_123")
+    content: MemoryContent = Field(..., description="Content to store in memory")
+    user_id: str = Field(..., description="User identifier")
 
 
 class MemoryStoreResponse(BaseModel):
@@ -39,6 +51,9 @@ class MemoryStoreResponse(BaseModel):
         memory_id: Optional ID of the stored memory
     """
 
+    # Never mutated after construction
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(..., description="Whether the operation was successful")
     message: str = Field(..., description="Status message")
     memory_id: str | None = Field(None, description="ID of the stored memory")
@@ -49,25 +64,55 @@ class MemoryRetrieveRequest(BaseModel):
     Request model for retrieving memories.
 
     Attributes:
+        action: Memory operation tag
         query: Search query for memory retrieval
         user_id: User identifier
         min_score: Minimum relevance score threshold
         max_results: Maximum number of results to return
     """
 
-    query: str = Field(
-        ...,
-        description="Search query",
-        min_length=1,
-        example="What are my savings goals?",
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [{"query": "What are my savings goals?", "user_id": "user_123"}]
+        }
     )
-    user_id: str = Field(..., description="User identifier", example="user_123")
+
+    action: Literal[MemoryAction.RETRIEVE] = Field(
+        MemoryAction.RETRIEVE, description="Memory operation tag"
+    )
+    query: NonEmptyText = Field(..., description="Search query")
+    user_id: str = Field(..., description="User identifier")
     min_score: float = Field(
         0.3, description="Minimum relevance score threshold", ge=0.0, le=1.0
     )
     max_results: int = Field(5, description="Maximum number of results", ge=1, le=20)
 
 
+class MemoryListRequest(BaseModel):
+    """
+    Request model for listing all user memories.
+
+    Attributes:
+        action: Memory operation tag
+        user_id: User identifier
+    """
+
+    model_config = ConfigDict(json_schema_extra={"examples": [{"user_id": "user_123"}]})
+
+    action: Literal[MemoryAction.LIST] = Field(
+        MemoryAction.LIST, description="Memory operation tag"
+    )
+    user_id: str = Field(..., description="User identifier")
+
+
+# Any memory operation, dispatched on the action tag by pydantic-core instead
+# of trying each member in turn
+MemoryRequest = Annotated[
+    MemoryStoreRequest | MemoryRetrieveRequest | MemoryListRequest,
+    Field(discriminator="action"),
+]
+
+
 class MemoryRetrieveResponse(BaseModel):
     """
     Response model for memory retrieval.
@@ -5,7 +5,9 @@ This module contains Pydantic models for portfolio operations,
 orchestration, and performance tracking.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._types import NonEmptyText
 
 # This file is prepared for future portfolio-specific schemas
 # Currently, portfolio functionality uses existing schemas
@@ -17,11 +19,20 @@ class PortfolioOrchestrationRequest(BaseModel):
     Request model for portfolio orchestration.
 
     Attributes:
-        user_request: Natural language request for portfolio operations
+        request: Natural language request for portfolio operations
     """
 
-    user_request: str = Field(
-        ...,
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "request": "Create a diversified portfolio with 70% stocks and 30% bonds"
+                }
+            ]
+        }
+    )
+
+    request: NonEmptyText = Field(
+        "Create an optimal investment portfolio",
         description="Natural language request for portfolio operations",
-        example="Create a diversified portfolio with 70% stocks and 30% bonds",
     )
@@ -9,11 +9,20 @@ This module contains business logic services that handle:
 
 Exports:
     - AgentService: Main service class for managing Strands Agents
+    - AgentNotFoundError: Raised when a user has no active agent
     - AgentManager: Core agent lifecycle management with Gemini models
     - AgentType: Enumeration of available agent types
+    - get_agent_service: Function to get the shared AgentService instance
 """
 
 from .agent_manager import AgentManager, AgentType
-from .agent_service import AgentService
+from .agent_service import AgentNotFoundError, AgentService
+from .container import get_agent_service
 
-__all__ = ["AgentManager", "AgentService", "AgentType"]
+__all__ = [
+    "AgentManager",
+    "AgentNotFoundError",
+    "AgentService",
+    "AgentType",
+    "get_agent_service",
+]
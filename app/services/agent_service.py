@@ -5,15 +5,67 @@ This module provides a single entry point for all agent operations using
 Strands Agents SDK with Google Gemini models.
 """
 
-import datetime
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from functools import lru_cache
+import hashlib
+import itertools
 import logging
 import random
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
+import uuid
 
-from .agent_manager import AgentManager, AgentType
+from anyio import to_thread
+
+from .agent_manager import AgentManager, AgentType, current_month
+from .cache import TTLCache
+
+if TYPE_CHECKING:
+    from strands_tools.mem0_memory import Mem0ServiceClient
 
 logger = logging.getLogger(__name__)
 
+# Users whose cache generation is tracked before the oldest is dropped
+_MAX_TRACKED_GENERATIONS = 10_000
+
+
+# (bucket, share of income, percentage) for the 50/30/20 rule
+_BUDGET_SPLITS = (
+    ("needs", 0.50, 50),
+    ("wants", 0.30, 30),
+    ("savings", 0.20, 20),
+)
+
+
+@lru_cache(maxsize=1024)
+def _budget_breakdown(income_cents: int) -> dict[str, Any]:
+    """Compute the 50/30/20 buckets for an income quantized to cents."""
+    monthly_income = income_cents / 100
+
+    return {
+        bucket: {"amount": monthly_income * share, "percentage": percentage}
+        for bucket, share, percentage in _BUDGET_SPLITS
+    }
+
+
+# Sample spending categories with the (low, high) monthly amount range each
+# is drawn from; amounts are sampled fresh on every request
+_SAMPLE_SPENDING_RANGES = (
+    ("Housing", 1200, 2000),
+    ("Food", 400, 800),
+    ("Transportation", 200, 600),
+    ("Entertainment", 100, 400),
+    ("Utilities", 150, 300),
+    ("Healthcare", 100, 500),
+    ("Personal", 100, 300),
+    ("Savings", 200, 1000),
+)
+
+
+class AgentNotFoundError(LookupError):
+    """Raised when a read-only lookup targets a user with no active agent."""
+
 
 class AgentService:
     """
@@ -21,7 +73,7 @@ class AgentService:
 
     This service acts as a unified interface for:
     - Agent lifecycle management
-    - Memory operations using strands_tools.mem0_memory
+    - Memory operations using the mem0 client from strands_tools
     - Budget and financial analysis
     - Portfolio orchestration
     """
@@ -29,8 +81,32 @@ class AgentService:
     def __init__(self):
         """Initialize the agent service with all components."""
         self.agent_manager = AgentManager()
+        self._mem0_client: Mem0ServiceClient | None = None
+        self._mem0_lock = threading.Lock()
         self._cached_stock_data = {}
-        self._cached_portfolios = {}
+
+        settings = self.agent_manager.settings
+        self._memory_cache = TTLCache(
+            maxsize=settings.memory_cache_size, ttl=settings.memory_cache_ttl
+        )
+        self._memory_list_cache_ttl = settings.memory_list_cache_ttl
+        self._chat_cache = TTLCache(
+            maxsize=settings.chat_cache_size, ttl=settings.chat_cache_ttl
+        )
+        # Per-user cache generation, replaced on every write so stale cached
+        # results for the user are skipped; see _cache_key
+        self._cache_generation: OrderedDict[str, int] = OrderedDict()
+        self._generation_counter = itertools.count(1)
+        self._generation_floor = 0
+        self._generation_lock = threading.Lock()
+        # Portfolio orchestration jobs by ID; finished jobs expire after the TTL
+        self._portfolio_jobs = TTLCache(
+            maxsize=settings.portfolio_job_cache_size,
+            ttl=settings.portfolio_job_ttl,
+        )
+        self._portfolio_data_cache = TTLCache(
+            maxsize=1, ttl=settings.portfolio_data_cache_ttl
+        )
 
     # Chat and Agent Management
     def chat(
@@ -39,100 +115,380 @@ class AgentService:
         message: str,
         agent_type: AgentType = AgentType.MEMORY,
         session_id: str | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
-        """Chat with specified agent type."""
-        return self.agent_manager.chat(user_id, message, agent_type, session_id)
+        """
+        Chat with specified agent type.
+
+        When the client sends an idempotency key, the reply is cached for the
+        chat cache TTL and a retry with the same key and message gets it back
+        instead of sending the turn to the agent again. Turns without a key
+        always reach the agent.
+        """
+        cache_key = self._chat_cache_key(
+            user_id, message, agent_type, session_id, idempotency_key
+        )
+        if cache_key is not None:
+            cached = self._chat_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = self.agent_manager.chat(user_id, message, agent_type, session_id)
+        if cache_key is not None:
+            self._chat_cache.set(cache_key, result)
+        return result
+
+    async def achat(
+        self,
+        user_id: str,
+        message: str,
+        agent_type: AgentType = AgentType.MEMORY,
+        session_id: str | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Chat with specified agent type without blocking the event loop."""
+        cache_key = self._chat_cache_key(
+            user_id, message, agent_type, session_id, idempotency_key
+        )
+        if cache_key is not None:
+            cached = self._chat_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = await self.agent_manager.achat(
+            user_id, message, agent_type, session_id
+        )
+        if cache_key is not None:
+            self._chat_cache.set(cache_key, result)
+        return result
+
+    def _chat_cache_key(
+        self,
+        user_id: str,
+        message: str,
+        agent_type: AgentType,
+        session_id: str | None,
+        idempotency_key: str | None,
+    ) -> str | None:
+        """Build the chat cache key for a retryable turn, or None if uncached."""
+        if idempotency_key is None:
+            return None
+        return self._cache_key(
+            user_id, "chat", idempotency_key, session_id, agent_type, message
+        )
+
+    def stream_chat(
+        self,
+        user_id: str,
+        message: str,
+        agent_type: AgentType = AgentType.MEMORY,
+        session_id: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a chat response from the specified agent type."""
+        return self.agent_manager.stream_chat(user_id, message, agent_type, session_id)
 
     def get_agent_state(self, user_id: str) -> dict[str, Any]:
-        """Get agent state information."""
-        try:
-            agent = self.agent_manager.get_or_create_agent(user_id, AgentType.MEMORY)
+        """
+        Get agent state information.
 
+        Raises:
+            AgentNotFoundError: If the user has no active memory agent
+        """
+        agent = self._require_agent(user_id)
+        try:
             return {
                 "agent_id": f"{user_id}_memory",
                 "message_count": len(agent.messages),
                 "state": {"status": "active", "model": "gemini"},
-                "available_tools": agent.tool_names
+                "available_tools": tuple(agent.tool_names)
                 if hasattr(agent, "tool_names")
-                else [],
+                else (),
             }
         except Exception as e:
-            logger.error(f"Failed to get agent state: {e!s}")
+            logger.error("Failed to get agent state: %s", e)
             raise
 
     def get_conversation_history(self, user_id: str) -> list[dict[str, Any]]:
-        """Get conversation history."""
+        """
+        Get conversation history.
+
+        Raises:
+            AgentNotFoundError: If the user has no active memory agent
+        """
+        agent = self._require_agent(user_id)
         try:
-            agent = self.agent_manager.get_or_create_agent(user_id, AgentType.MEMORY)
-
-            return [
-                {
-                    "role": msg.get("role", "unknown"),
-                    "content": msg.get("content", ""),
-                    "timestamp": msg.get("timestamp", ""),
-                }
-                for msg in agent.messages
-            ]
+            return [self._history_entry(msg) for msg in agent.messages]
         except Exception as e:
-            logger.error(f"Failed to get conversation history: {e!s}")
+            logger.error("Failed to get conversation history: %s", e)
             raise
 
+    def get_conversation_history_page(
+        self, user_id: str, offset: int = 0, limit: int = 50
+    ) -> dict[str, Any]:
+        """
+        Get one page of conversation history.
+
+        Only the messages in ``[offset, offset + limit)`` are formatted, so the
+        cost of a request is bounded by the page size rather than the length
+        of the transcript.
+
+        Args:
+            user_id: User identifier
+            offset: Index of the first message to return
+            limit: Maximum number of messages to return
+
+        Returns:
+            Dict with the page of messages, next_cursor and has_more
+
+        Raises:
+            AgentNotFoundError: If the user has no active memory agent
+        """
+        agent = self._require_agent(user_id)
+        try:
+            end = offset + limit
+            has_more = end < len(agent.messages)
+            return {
+                "messages": [
+                    self._history_entry(msg) for msg in agent.messages[offset:end]
+                ],
+                "next_cursor": end if has_more else None,
+                "has_more": has_more,
+            }
+        except Exception as e:
+            logger.error("Failed to get conversation history: %s", e)
+            raise
+
+    def _require_agent(self, user_id: str) -> Any:
+        """
+        Look up the user's memory agent for a read-only request.
+
+        Reads never create agents, so lookups for unknown users fail fast
+        with a dict miss instead of building a model and agent first.
+        """
+        agent = self.agent_manager.get_agent(user_id, AgentType.MEMORY)
+        if agent is None:
+            raise AgentNotFoundError(user_id)
+        return agent
+
+    @staticmethod
+    def _history_entry(msg: dict[str, Any]) -> dict[str, Any]:
+        """Map an agent message to the conversation history shape."""
+        return {
+            "role": msg.get("role", "unknown"),
+            "content": msg.get("content", ""),
+            "timestamp": msg.get("timestamp", ""),
+        }
+
     def reset_agent(self, user_id: str) -> None:
         """Reset agent by clearing conversation history and state."""
         try:
             # Remove from active agents cache
-            keys_to_remove = [
-                key
-                for key in self.agent_manager.agents
-                if key.startswith(f"{user_id}_")
-            ]
-            for key in keys_to_remove:
-                del self.agent_manager.agents[key]
-
-            logger.info(f"Reset all agents for user: {user_id}")
+            self.agent_manager.remove_user_agents(user_id)
+            self._invalidate_user_cache(user_id)
+
+            logger.info("Reset all agents for user: %s", user_id)
         except Exception as e:
-            logger.error(f"Failed to reset agent: {e!s}")
+            logger.error("Failed to reset agent: %s", e)
             raise
 
-    # Memory Operations (using strands_tools.mem0_memory directly)
-    def initialize_user_preferences(
-        self, user_id: str, preferences: str
+    async def aget_agent_state(self, user_id: str) -> dict[str, Any]:
+        """Get agent state without blocking the event loop."""
+        return await to_thread.run_sync(self.get_agent_state, user_id)
+
+    async def aget_conversation_history(self, user_id: str) -> list[dict[str, Any]]:
+        """Get conversation history without blocking the event loop."""
+        return await to_thread.run_sync(self.get_conversation_history, user_id)
+
+    async def aget_conversation_history_page(
+        self, user_id: str, offset: int = 0, limit: int = 50
     ) -> dict[str, Any]:
-        """Initialize user preferences in memory using memory agent."""
+        """Get one page of conversation history without blocking the event loop."""
+        return await to_thread.run_sync(
+            self.get_conversation_history_page, user_id, offset, limit
+        )
+
+    async def areset_agent(self, user_id: str) -> None:
+        """Reset agents without blocking the event loop."""
+        await to_thread.run_sync(self.reset_agent, user_id)
+
+    # Memory Operations (using the mem0 client behind strands_tools.mem0_memory)
+    def _memory_client(self) -> "Mem0ServiceClient":
+        """
+        Return the shared mem0 client, creating it on first use.
+
+        The mem0_memory tool builds a new client (and its HTTP session or
+        vector store connection) on every call; service-level memory
+        operations reuse one for the life of the process instead.
+        mem0 and its vector store backends are imported on this first use,
+        not at startup.
+        """
+        if self._mem0_client is None:
+            with self._mem0_lock:
+                if self._mem0_client is None:
+                    from strands_tools.mem0_memory import Mem0ServiceClient
+
+                    self._mem0_client = Mem0ServiceClient()
+        return self._mem0_client
+
+    @staticmethod
+    def _memory_results(payload: Any) -> list[dict[str, Any]]:
+        """Normalize mem0 responses (list or {"results": [...]}) to a list."""
+        if isinstance(payload, dict):
+            payload = payload.get("results", [])
+        return payload if isinstance(payload, list) else []
+
+    def _cache_key(self, user_id: str, kind: str, *parts: Any) -> str:
+        """
+        Build a cache key from a hash of the user's request parameters.
+
+        Keys are prefixed with their kind ("chat" or "memory") and include the
+        user's current cache generation, so results cached before the user's
+        last write are never returned.
+        """
+        with self._generation_lock:
+            generation = self._cache_generation.get(user_id, self._generation_floor)
+        raw = "|".join(str(part) for part in (user_id, generation, kind, *parts))
+        return f"{kind}:" + hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    def _invalidate_user_cache(self, user_id: str) -> None:
+        """
+        Invalidate cached chat and memory results for a user.
+
+        The user gets a fresh, process-unique generation. At most
+        _MAX_TRACKED_GENERATIONS users are tracked; when the least recently
+        invalidated one is dropped, the generation shared by untracked users
+        moves to a fresh value too, so dropping a user never revives stale
+        results.
+        """
+        with self._generation_lock:
+            self._cache_generation[user_id] = next(self._generation_counter)
+            self._cache_generation.move_to_end(user_id)
+            if len(self._cache_generation) > _MAX_TRACKED_GENERATIONS:
+                self._cache_generation.popitem(last=False)
+                self._generation_floor = next(self._generation_counter)
+
+    def store_memory(self, user_id: str, content: str) -> dict[str, Any]:
+        """Store content in long-term memory."""
+        try:
+            results = self._memory_results(
+                self._memory_client().store_memory(content, user_id=user_id)
+            )
+            self._invalidate_user_cache(user_id)
+
+            return {
+                "success": True,
+                "message": "Memory stored successfully",
+                "result": results[0] if results else {},
+            }
+        except Exception as e:
+            logger.error("Memory storage error: %s", e)
+            raise
+
+    def retrieve_memories(
+        self,
+        user_id: str,
+        query: str,
+        min_score: float = 0.3,
+        max_results: int = 5,
+    ) -> dict[str, Any]:
+        """Retrieve memories relevant to a query using semantic search."""
+        cache_key = self._cache_key(user_id, "memory", query, min_score, max_results)
+        cached = self._memory_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            results = self._memory_results(
+                self._memory_client().search_memories(query, user_id=user_id)
+            )
+            results = [mem for mem in results if (mem.get("score") or 0.0) >= min_score]
+
+            memories = {"success": True, "results": results[:max_results]}
+            self._memory_cache.set(cache_key, memories)
+            return memories
+        except Exception as e:
+            logger.error("Memory retrieval error: %s", e)
+            raise
+
+    def list_all_memories(self, user_id: str) -> dict[str, Any]:
+        """List all stored memories for a user."""
+        cache_key = self._cache_key(user_id, "memory", "list")
+        cached = self._memory_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Create memory agent with user preferences
-            agent = self.agent_manager.get_or_create_agent(
-                user_id=user_id,
-                agent_type=AgentType.MEMORY,
+            results = self._memory_results(
+                self._memory_client().list_memories(user_id=user_id)
             )
 
-            # Store preferences using mem0_memory tool
+            memories = {"success": True, "results": results}
+            self._memory_cache.set(cache_key, memories, ttl=self._memory_list_cache_ttl)
+            return memories
+        except Exception as e:
+            logger.error("Memory listing error: %s", e)
+            raise
+
+    async def astore_memory(self, user_id: str, content: str) -> dict[str, Any]:
+        """Store a memory without blocking the event loop."""
+        return await to_thread.run_sync(self.store_memory, user_id, content)
+
+    async def aretrieve_memories(
+        self,
+        user_id: str,
+        query: str,
+        min_score: float = 0.3,
+        max_results: int = 5,
+    ) -> dict[str, Any]:
+        """Retrieve memories without blocking the event loop."""
+        return await to_thread.run_sync(
+            self.retrieve_memories, user_id, query, min_score, max_results
+        )
+
+    async def alist_all_memories(self, user_id: str) -> dict[str, Any]:
+        """List all memories without blocking the event loop."""
+        return await to_thread.run_sync(self.list_all_memories, user_id)
+
+    def initialize_user_preferences(
+        self, user_id: str, preferences: str
+    ) -> dict[str, Any]:
+        """Initialize user preferences in long-term memory."""
+        try:
             content = f"USER PREFERENCES: {preferences}"
-            agent.tool.mem0_memory(action="store", content=content, user_id=user_id)
+            self._memory_client().store_memory(content, user_id=user_id)
+            self._invalidate_user_cache(user_id)
 
             return {
                 "success": True,
                 "message": "User preferences initialized successfully",
             }
         except Exception as e:
-            logger.error(f"Preference initialization error: {e!s}")
+            logger.error("Preference initialization error: %s", e)
             return {
                 "success": False,
                 "message": f"Preference initialization failed: {e!s}",
             }
 
+    async def ainitialize_user_preferences(
+        self, user_id: str, preferences: str
+    ) -> dict[str, Any]:
+        """Initialize user preferences without blocking the event loop."""
+        return await to_thread.run_sync(
+            self.initialize_user_preferences, user_id, preferences
+        )
+
     # Budget and Financial Analysis
     def calculate_50_30_20_budget(self, monthly_income: float) -> dict[str, Any]:
-        """Calculate 50/30/20 budget breakdown."""
-        needs = monthly_income * 0.50
-        wants = monthly_income * 0.30
-        savings = monthly_income * 0.20
+        """
+        Calculate 50/30/20 budget breakdown.
 
+        The bucket amounts are memoized per income rounded to cents and shared
+        between callers, so they must be treated as read-only; the income and
+        total echo the caller's ``monthly_income`` unchanged.
+        """
         return {
             "monthly_income": monthly_income,
-            "needs": {"amount": needs, "percentage": 50},
-            "wants": {"amount": wants, "percentage": 30},
-            "savings": {"amount": savings, "percentage": 20},
+            **_budget_breakdown(round(monthly_income * 100)),
             "total": monthly_income,
         }
 
@@ -142,31 +498,25 @@ class AgentService:
             "title": title,
             "data": data,
             "chart_type": "pie",
-            "labels": list(data.keys()),
-            "values": list(data.values()),
+            "labels": tuple(data),
+            "values": tuple(data.values()),
         }
 
     def generate_sample_spending_data(self) -> dict[str, Any]:
         """Generate sample spending data."""
         categories = {
-            "Housing": random.uniform(1200, 2000),
-            "Food": random.uniform(400, 800),
-            "Transportation": random.uniform(200, 600),
-            "Entertainment": random.uniform(100, 400),
-            "Utilities": random.uniform(150, 300),
-            "Healthcare": random.uniform(100, 500),
-            "Personal": random.uniform(100, 300),
-            "Savings": random.uniform(200, 1000),
+            category: random.uniform(low, high)
+            for category, low, high in _SAMPLE_SPENDING_RANGES
         }
 
-        current_month = datetime.datetime.now().strftime("%B %Y")
+        month = current_month()
         total = sum(categories.values())
 
         return {
             "categories": categories,
             "total": round(total, 2),
-            "month": current_month,
-            "description": f"Sample spending data for {current_month}",
+            "month": month,
+            "description": f"Sample spending data for {month}",
         }
 
     # Portfolio Operations
@@ -191,15 +541,70 @@ class AgentService:
                 },
             }
         except Exception as e:
-            logger.error(f"Portfolio orchestration error: {e!s}")
+            logger.error("Portfolio orchestration error: %s", e)
             raise
 
+    def start_portfolio_job(self, user_request: str) -> str:
+        """Register a pending portfolio orchestration job and return its ID."""
+        job_id = uuid.uuid4().hex
+        self._portfolio_jobs.set(
+            job_id,
+            {
+                "job_id": job_id,
+                "status": "pending",
+                "request": user_request,
+            },
+        )
+        return job_id
+
+    async def run_portfolio_job(self, job_id: str, user_request: str) -> None:
+        """Run a portfolio orchestration job and cache its outcome."""
+        job = {"job_id": job_id, "request": user_request}
+        try:
+            job["result"] = self.orchestrate_portfolio(user_request)
+            job["status"] = "completed"
+        except Exception:
+            logger.exception("Portfolio job %s failed", job_id)
+            job["status"] = "failed"
+
+        # Re-setting the job restarts its TTL from completion
+        self._portfolio_jobs.set(job_id, job)
+        self._portfolio_data_cache.clear()
+
+    def get_portfolio_job(self, job_id: str) -> dict[str, Any] | None:
+        """Get a portfolio orchestration job by ID."""
+        return self._portfolio_jobs.get(job_id)
+
     def get_cached_portfolios(self) -> dict[str, Any]:
-        """Retrieve all cached portfolio data."""
-        return self._cached_portfolios
+        """Retrieve finished portfolio jobs that have not expired, by ID."""
+        return {
+            job_id: job
+            for job_id, job in self._portfolio_jobs.items()
+            if job["status"] != "pending"
+        }
+
+    def get_portfolio_data(self) -> dict[str, Any]:
+        """
+        Get the portfolio data response payload.
+
+        Lists finished jobs only. The payload is cached until the TTL expires,
+        a portfolio job finishes or the cache is cleared; it must be treated
+        as read-only.
+        """
+        payload = self._portfolio_data_cache.get("portfolio_data")
+        if payload is None:
+            portfolios = self.get_cached_portfolios()
+            payload = {
+                "success": True,
+                "portfolios": portfolios,
+                "count": len(portfolios),
+            }
+            self._portfolio_data_cache.set("portfolio_data", payload)
+        return payload
 
     def clear_cache(self) -> None:
         """Clear all cached data."""
         self._cached_stock_data.clear()
-        self._cached_portfolios.clear()
+        self._portfolio_jobs.clear()
+        self._portfolio_data_cache.clear()
         logger.info("All cache cleared successfully")
@@ -0,0 +1,25 @@
+"""
+Service container - Shared service instances for the API layer.
+
+This module provides a single, lazily constructed AgentService instance
+shared by every route module, so agent caches and model clients are not
+duplicated per router.
+"""
+
+from functools import lru_cache
+
+from .agent_service import AgentService
+
+
+@lru_cache(maxsize=1)
+def get_agent_service() -> AgentService:
+    """
+    Get the shared agent service instance.
+
+    The instance is created on first use and reused across the
+    application lifecycle.
+
+    Returns:
+        AgentService: The shared agent service instance
+    """
+    return AgentService()
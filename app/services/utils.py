@@ -7,16 +7,33 @@ All visualization functionality has been removed.
 """
 
 import logging
+from pathlib import Path
+import time
 from typing import Any
 import warnings
 
 import numpy as np
-import pandas as pd
-import yfinance as yf
 
 warnings.filterwarnings("ignore")
 logger = logging.getLogger(__name__)
 
+# Cached market data files older than this many seconds are refetched
+STOCK_CACHE_TTL = 24 * 60 * 60
+
+
+def _is_fresh(cache_file: str) -> bool:
+    """Check that a cache file exists and is younger than STOCK_CACHE_TTL."""
+    try:
+        age = time.time() - Path(cache_file).stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return age < STOCK_CACHE_TTL
+
+
+def _prepare_cache_dir(cache_file: str) -> None:
+    """Create the parent directory of a cache file if needed."""
+    Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+
 
 def get_stock_data(
     tickers: list[str], start_date: str, end_date: str, cache_file: str | None = None
@@ -28,30 +45,33 @@ def get_stock_data(
         tickers: List of stock ticker symbols
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
-        cache_file: Optional CSV file path for caching
+        cache_file: Optional CSV file path for caching; files older than
+            STOCK_CACHE_TTL are refetched
 
     Returns:
         Dict containing stock data and metadata
     """
+    # pandas and yfinance are imported on first use to keep module import cheap
+    import pandas as pd
+    import yfinance as yf
+
     try:
-        if cache_file:
-            try:
-                df = pd.read_csv(cache_file, index_col=0, parse_dates=True)
-                logger.info(f"Loaded data from cache: {cache_file}")
-                return {"data": df, "tickers": tickers}
-            except FileNotFoundError:
-                pass
+        if cache_file and _is_fresh(cache_file):
+            df = pd.read_csv(cache_file, index_col=0, parse_dates=True)
+            logger.info("Loaded data from cache: %s", cache_file)
+            return {"data": df, "tickers": tickers}
 
         df = yf.download(tickers, start=start_date, end=end_date)["Adj Close"]
 
         if cache_file:
+            _prepare_cache_dir(cache_file)
             df.to_csv(cache_file)
-            logger.info(f"Saved data to cache: {cache_file}")
+            logger.info("Saved data to cache: %s", cache_file)
 
         return {"data": df, "tickers": tickers}
 
     except Exception as e:
-        logger.error(f"Error fetching stock data: {e!s}")
+        logger.error("Error fetching stock data: %s", e)
         raise
 
 
@@ -65,20 +85,21 @@ def get_stock_analysis(
         tickers: List of stock ticker symbols
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
-        cache_file: Optional CSV file path for caching
+        cache_file: Optional CSV file path for caching; files older than
+            STOCK_CACHE_TTL are refetched
 
     Returns:
         Dict containing summary metrics
     """
+    import pandas as pd
+    import yfinance as yf
+
     try:
-        if cache_file:
-            try:
-                summary_df = pd.read_csv(cache_file)
-                summary = summary_df.set_index("ticker").to_dict("index")
-                logger.info(f"Loaded analysis from cache: {cache_file}")
-                return {"summary_metrics": summary, "tickers": tickers}
-            except FileNotFoundError:
-                pass
+        if cache_file and _is_fresh(cache_file):
+            summary_df = pd.read_csv(cache_file, index_col=0)
+            summary = summary_df.to_dict("index")
+            logger.info("Loaded analysis from cache: %s", cache_file)
+            return {"summary_metrics": summary, "tickers": tickers}
 
         df = yf.download(tickers, start=start_date, end=end_date)["Adj Close"]
 
@@ -115,13 +136,14 @@ def get_stock_analysis(
 
         if cache_file:
             summary_df = pd.DataFrame.from_dict(summary_metrics, orient="index")
+            _prepare_cache_dir(cache_file)
             summary_df.to_csv(cache_file)
-            logger.info(f"Saved analysis to cache: {cache_file}")
+            logger.info("Saved analysis to cache: %s", cache_file)
 
         return {"summary_metrics": summary_metrics, "tickers": tickers}
 
     except Exception as e:
-        logger.error(f"Error fetching stock analysis: {e!s}")
+        logger.error("Error fetching stock analysis: %s", e)
         raise
 
 
@@ -189,7 +211,7 @@ def create_growth_portfolio(
         }
 
     except Exception as e:
-        logger.error(f"Error creating growth portfolio: {e!s}")
+        logger.error("Error creating growth portfolio: %s", e)
         raise
 
 
@@ -255,10 +277,24 @@ def create_diversified_portfolio(
         }
 
     except Exception as e:
-        logger.error(f"Error creating diversified portfolio: {e!s}")
+        logger.error("Error creating diversified portfolio: %s", e)
         raise
 
 
+def _metric_array(
+    metrics: dict[str, Any], tickers: dict[str, Any], key: str, fallback_key: str
+) -> np.ndarray:
+    """Collect one metric per ticker, in allocation order, as a float array."""
+    return np.fromiter(
+        (
+            metrics[ticker].get(key, metrics[ticker].get(fallback_key, 0))
+            for ticker in tickers
+        ),
+        dtype=np.float64,
+        count=len(tickers),
+    )
+
+
 def calculate_portfolio_performance(
     portfolio: dict[str, Any],
     stock_data: dict[str, Any],
@@ -279,20 +315,19 @@ def calculate_portfolio_performance(
         allocation = portfolio["allocation"]
         metrics = stock_data["summary_metrics"]
 
-        weighted_return = sum(
-            (allocation[ticker] / 100)
-            * metrics[ticker].get("annual_return", metrics[ticker].get("return_pct", 0))
-            for ticker in allocation
+        # Weights and per-ticker metrics as aligned arrays; one dot product each
+        weights = (
+            np.fromiter(allocation.values(), dtype=np.float64, count=len(allocation))
+            / 100
         )
-
-        weighted_volatility = sum(
-            (allocation[ticker] / 100)
-            * metrics[ticker].get(
-                "volatility", metrics[ticker].get("volatility_pct", 0)
-            )
-            for ticker in allocation
+        returns = _metric_array(metrics, allocation, "annual_return", "return_pct")
+        volatilities = _metric_array(
+            metrics, allocation, "volatility", "volatility_pct"
         )
 
+        weighted_return = float(weights @ returns)
+        weighted_volatility = float(weights @ volatilities)
+
         final_value = investment_amount * (1 + weighted_return / 100)
         profit = final_value - investment_amount
 
@@ -315,7 +350,7 @@ def calculate_portfolio_performance(
         }
 
     except Exception as e:
-        logger.error(f"Error calculating portfolio performance: {e!s}")
+        logger.error("Error calculating portfolio performance: %s", e)
         raise
 
 
@@ -337,6 +372,8 @@ def validate_portfolio_performance(
     Returns:
         Validation results with actual performance
     """
+    import yfinance as yf
+
     try:
         allocation = portfolio["allocation"]
         tickers = list(allocation.keys())
@@ -351,20 +388,19 @@ def validate_portfolio_performance(
         # Calculate daily returns
         returns = df.pct_change().dropna()
 
-        # Calculate portfolio returns based on allocation
-        portfolio_returns = sum(
-            returns[ticker] * allocation[ticker] / 100 for ticker in allocation
-        )
+        # Calculate portfolio returns based on allocation: one matrix-vector
+        # product over the (days x tickers) return matrix
+        weights = np.fromiter(allocation.values(), dtype=np.float64) / 100
+        portfolio_returns = returns[tickers].to_numpy(dtype=np.float64) @ weights
 
         # Cumulative returns
-        cumulative_returns = (1 + portfolio_returns).cumprod()
-        final_value = initial_investment * cumulative_returns.iloc[-1]
+        final_value = float(initial_investment * np.prod(1 + portfolio_returns))
         total_return = (final_value / initial_investment - 1) * 100
 
         # Annualized metrics
         trading_days = len(returns)
         annual_return = total_return * (252 / trading_days)
-        annual_volatility = portfolio_returns.std() * np.sqrt(252)
+        annual_volatility = float(portfolio_returns.std(ddof=1) * np.sqrt(252))
 
         return {
             "success": True,
@@ -378,5 +414,5 @@ def validate_portfolio_performance(
         }
 
     except Exception as e:
-        logger.error(f"Error validating portfolio: {e!s}")
+        logger.error("Error validating portfolio: %s", e)
         return {"success": False, "message": f"Validation error: {e!s}"}
@@ -0,0 +1,31 @@
+"""
+Shared test fixtures.
+
+Tests run without network access: the Gemini key is a placeholder and
+model calls are patched where a test needs an agent response.
+"""
+
+import os
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+# Keep test runs from writing app.log
+os.environ.setdefault("LOG_FILE", "")
+
+from fastapi.testclient import TestClient
+import pytest
+
+from app.main import app
+from app.services.agent_service import AgentService
+
+
+@pytest.fixture
+def service() -> AgentService:
+    """Fresh agent service with empty caches."""
+    return AgentService()
+
+
+@pytest.fixture
+def client():
+    """Test client with the application lifespan running."""
+    with TestClient(app) as test_client:
+        yield test_client
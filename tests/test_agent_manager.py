@@ -0,0 +1,101 @@
+"""Tests for agent caching in AgentManager."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import agent_manager
+from app.services.agent_manager import AgentManager, AgentType
+
+
+def _fake_agent() -> SimpleNamespace:
+    return SimpleNamespace(messages=[], cleanup=lambda: None)
+
+
+@pytest.fixture
+def manager() -> AgentManager:
+    return AgentManager()
+
+
+def test_cache_hits_are_not_blocked_by_a_build(manager):
+    cached = manager.get_or_create_agent("cached", AgentType.FINANCIAL)
+    building = threading.Event()
+    release = threading.Event()
+
+    def slow_build():
+        building.set()
+        release.wait(timeout=5)
+        return _fake_agent()
+
+    manager._builders[AgentType.BASIC] = slow_build
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(manager.get_or_create_agent, "new", AgentType.BASIC)
+        assert building.wait(timeout=5)
+
+        # The build above is still running; another user's lookup returns
+        assert manager.get_or_create_agent("cached", AgentType.FINANCIAL) is cached
+
+        release.set()
+        pending.result(timeout=5)
+
+
+def test_concurrent_misses_for_one_key_build_once(manager):
+    builds = []
+
+    def build():
+        builds.append(threading.current_thread())
+        return _fake_agent()
+
+    manager._builders[AgentType.BASIC] = build
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        agents = list(
+            pool.map(
+                lambda _: manager.get_or_create_agent("u1", AgentType.BASIC), range(8)
+            )
+        )
+
+    assert len(builds) == 1
+    assert all(agent is agents[0] for agent in agents)
+    assert not manager._pending
+
+
+def test_async_lookup_builds_off_the_event_loop(manager):
+    builder_threads = []
+
+    def build():
+        builder_threads.append(threading.current_thread())
+        return _fake_agent()
+
+    manager._builders[AgentType.BASIC] = build
+    asyncio.run(manager.aget_or_create_agent("u1", AgentType.BASIC))
+
+    assert builder_threads
+    assert builder_threads[0] is not threading.main_thread()
+
+
+def test_evicted_agents_are_cleaned_up(manager):
+    cleaned = []
+    manager._max_agents = 1
+    manager._builders[AgentType.BASIC] = lambda: SimpleNamespace(
+        messages=[], cleanup=lambda: cleaned.append(True)
+    )
+
+    manager.get_or_create_agent("u1", AgentType.BASIC)
+    manager.get_or_create_agent("u2", AgentType.BASIC)
+
+    assert list(manager.agents) == [("u2", AgentType.BASIC, "default")]
+    assert cleaned == [True]
+
+
+def test_warmup_keeps_heavy_tool_imports_deferred(manager):
+    agent_manager._budget_tools.cache_clear()
+    agent_manager._memory_tools.cache_clear()
+
+    manager.warmup()
+
+    assert agent_manager._budget_tools.cache_info().currsize == 0
+    assert agent_manager._memory_tools.cache_info().currsize == 0
+    assert not manager.agents
@@ -0,0 +1,48 @@
+"""Tests for the read-only agent state and history endpoints."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.agent_manager import AgentType
+
+READ_ENDPOINTS = ("/api/v1/agent/state/{}", "/api/v1/agent/history/{}")
+
+
+def _add_agent(client, key) -> SimpleNamespace:
+    agent = SimpleNamespace(
+        messages=[{"role": "user", "content": [{"text": "hi"}]}],
+        tool_names=["store_memory"],
+        cleanup=lambda: None,
+    )
+    client.app.state.agent_service.agent_manager.agents[key] = agent
+    return agent
+
+
+@pytest.mark.parametrize("path", READ_ENDPOINTS)
+def test_unknown_user_is_404(client, path):
+    response = client.get(path.format("nobody"))
+
+    assert response.status_code == 404
+    manager = client.app.state.agent_service.agent_manager
+    assert manager.get_agent("nobody", AgentType.MEMORY) is None
+
+
+@pytest.mark.parametrize("path", READ_ENDPOINTS)
+def test_user_without_default_memory_agent_is_404(client, path):
+    _add_agent(client, ("u1", AgentType.MEMORY, "session-1"))
+    _add_agent(client, ("u1", AgentType.BASIC, "default"))
+
+    assert client.get(path.format("u1")).status_code == 404
+
+
+def test_default_memory_agent_is_read(client):
+    _add_agent(client, ("u1", AgentType.MEMORY, "default"))
+
+    state = client.get("/api/v1/agent/state/u1")
+    history = client.get("/api/v1/agent/history/u1")
+
+    assert state.status_code == 200
+    assert state.json()["message_count"] == 1
+    assert history.status_code == 200
+    assert [m["role"] for m in history.json()["messages"]] == ["user"]
@@ -0,0 +1,32 @@
+"""Tests for the budget helpers in AgentService."""
+
+import pytest
+
+
+def test_budget_echoes_the_callers_income(service):
+    budget = service.calculate_50_30_20_budget(5000.004)
+
+    assert budget["monthly_income"] == 5000.004
+    assert budget["total"] == 5000.004
+    assert budget["needs"] == {"amount": 2500.0, "percentage": 50}
+    assert budget["wants"] == {"amount": 1500.0, "percentage": 30}
+    assert budget["savings"] == {"amount": 1000.0, "percentage": 20}
+
+
+def test_incomes_in_the_same_cent_share_buckets(service):
+    first = service.calculate_50_30_20_budget(5000.001)
+    second = service.calculate_50_30_20_budget(5000.002)
+
+    assert first["monthly_income"] != second["monthly_income"]
+    assert first["needs"] is second["needs"]
+    assert first["savings"]["amount"] == pytest.approx(1000.0)
+
+
+def test_sample_spending_data_is_drawn_fresh(service):
+    first = service.generate_sample_spending_data()
+    second = service.generate_sample_spending_data()
+
+    assert first is not second
+    assert first["categories"] != second["categories"]
+    assert 1200 <= first["categories"]["Housing"] <= 2000
+    assert first["total"] == round(sum(first["categories"].values()), 2)
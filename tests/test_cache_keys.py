@@ -0,0 +1,35 @@
+"""Tests for per-user cache keys and invalidation in AgentService."""
+
+from app.services import agent_service
+
+
+def test_keys_are_prefixed_by_kind(service):
+    assert service._cache_key("u1", "chat", "hi").startswith("chat:")
+    assert service._cache_key("u1", "memory", "hi").startswith("memory:")
+    assert service._cache_key("u1", "chat", "hi") != service._cache_key(
+        "u1", "memory", "hi"
+    )
+
+
+def test_invalidation_changes_only_that_users_keys(service):
+    before_u1 = service._cache_key("u1", "memory", "list")
+    before_u2 = service._cache_key("u2", "memory", "list")
+
+    service._invalidate_user_cache("u1")
+
+    assert service._cache_key("u1", "memory", "list") != before_u1
+    assert service._cache_key("u2", "memory", "list") == before_u2
+
+
+def test_dropping_tracked_user_never_revives_old_keys(service, monkeypatch):
+    monkeypatch.setattr(agent_service, "_MAX_TRACKED_GENERATIONS", 1)
+    untracked = service._cache_key("u3", "memory", "list")
+    service._invalidate_user_cache("u1")
+    after_u1 = service._cache_key("u1", "memory", "list")
+
+    # Tracking u2 drops u1; neither u1 nor untracked users reuse old keys
+    service._invalidate_user_cache("u2")
+
+    assert len(service._cache_generation) == 1
+    assert service._cache_key("u1", "memory", "list") != after_u1
+    assert service._cache_key("u3", "memory", "list") != untracked
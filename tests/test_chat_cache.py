@@ -0,0 +1,65 @@
+"""Tests for the chat response cache in AgentService."""
+
+from types import SimpleNamespace
+
+from app.services.agent_manager import AgentManager, AgentType
+
+
+def _fake_chat(monkeypatch):
+    """Route AgentManager.chat to a fake agent that records each turn."""
+    agent = SimpleNamespace(messages=[])
+
+    def chat(self, user_id, message, agent_type, session_id):
+        agent.messages += [{"role": "user"}, {"role": "assistant"}]
+        return {"response": f"reply {len(agent.messages)}"}
+
+    monkeypatch.setattr(AgentManager, "chat", chat)
+    return agent
+
+
+def test_turns_without_idempotency_key_always_reach_the_agent(service, monkeypatch):
+    agent = _fake_chat(monkeypatch)
+
+    first = service.chat("u1", "yes", AgentType.BASIC)
+    second = service.chat("u1", "yes", AgentType.BASIC)
+
+    assert first != second
+    assert len(agent.messages) == 4
+
+
+def test_retry_with_same_idempotency_key_returns_original_reply(service, monkeypatch):
+    agent = _fake_chat(monkeypatch)
+
+    first = service.chat("u1", "yes", AgentType.BASIC, idempotency_key="turn-1")
+    retried = service.chat("u1", "yes", AgentType.BASIC, idempotency_key="turn-1")
+
+    assert retried is first
+    assert len(agent.messages) == 2
+
+
+def test_new_idempotency_key_is_a_new_turn(service, monkeypatch):
+    agent = _fake_chat(monkeypatch)
+
+    service.chat("u1", "yes", AgentType.BASIC, idempotency_key="turn-1")
+    service.chat("u1", "yes", AgentType.BASIC, idempotency_key="turn-2")
+
+    assert len(agent.messages) == 4
+
+
+def test_chat_endpoint_passes_idempotency_key(client, monkeypatch):
+    calls = []
+
+    async def achat(self, user_id, message, agent_type, session_id):
+        calls.append(message)
+        return {"response": "ok", "user_id": user_id, "message_count": 2}
+
+    monkeypatch.setattr(AgentManager, "achat", achat)
+    headers = {"Idempotency-Key": "turn-1"}
+    body = {"message": "hi", "user_id": "idem-user"}
+
+    first = client.post("/api/v1/chat", json=body, headers=headers)
+    retried = client.post("/api/v1/chat", json=body, headers=headers)
+
+    assert first.status_code == retried.status_code == 200
+    assert retried.json() == first.json()
+    assert calls == ["hi"]
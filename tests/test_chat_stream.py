@@ -0,0 +1,16 @@
+"""Tests for the streaming chat endpoint."""
+
+from app.services.agent_service import AgentService
+
+
+def test_failure_mid_stream_ends_with_error_chunk(client, monkeypatch):
+    async def stream_chat(self, *args, **kwargs):
+        yield "partial "
+        raise RuntimeError("model went away")
+
+    monkeypatch.setattr(AgentService, "stream_chat", stream_chat)
+
+    response = client.post("/api/v1/chat/stream", json={"message": "hi"})
+
+    assert response.status_code == 200
+    assert response.text == "partial \n[ERROR] Chat failed\n"
@@ -0,0 +1,37 @@
+"""Tests for the MemoryRequest discriminated union."""
+
+from pydantic import TypeAdapter
+import pytest
+
+from app.models import (
+    MemoryListRequest,
+    MemoryRequest,
+    MemoryRetrieveRequest,
+    MemoryStoreRequest,
+)
+from app.models.base_schemas import MemoryAction
+
+_ADAPTER = TypeAdapter(MemoryRequest)
+
+
+@pytest.mark.parametrize(
+    ("action", "model", "extra"),
+    [
+        (MemoryAction.STORE, MemoryStoreRequest, {"content": "likes index funds"}),
+        (MemoryAction.RETRIEVE, MemoryRetrieveRequest, {"query": "funds"}),
+        (MemoryAction.LIST, MemoryListRequest, {}),
+    ],
+)
+def test_each_memory_action_selects_its_request_model(action, model, extra):
+    request = _ADAPTER.validate_python(
+        {"action": action.value, "user_id": "u1", **extra}
+    )
+
+    assert type(request) is model
+    assert request.action is action
+
+
+def test_unknown_action_is_rejected(client):
+    response = client.post("/api/v1/memory", json={"action": "forget", "user_id": "u1"})
+
+    assert response.status_code == 422
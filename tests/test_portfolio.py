@@ -0,0 +1,52 @@
+"""Tests for portfolio orchestration jobs."""
+
+import asyncio
+import time
+
+from app.services import cache
+
+
+def test_orchestration_job_completes(client):
+    accepted = client.post(
+        "/api/v1/portfolio/orchestrate", json={"request": "Build a portfolio"}
+    )
+    assert accepted.status_code == 202
+
+    job = client.get(f"/api/v1/portfolio/jobs/{accepted.json()['job_id']}").json()
+
+    assert job["status"] == "completed"
+    assert job["result"]["result"]["allocation"] == {
+        "Stocks": 60.0,
+        "Bonds": 30.0,
+        "Cash": 10.0,
+    }
+
+
+def test_portfolio_data_lists_finished_jobs_only(service):
+    pending = service.start_portfolio_job("pending")
+    finished = service.start_portfolio_job("finished")
+    asyncio.run(service.run_portfolio_job(finished, "finished"))
+
+    portfolios = service.get_portfolio_data()["portfolios"]
+
+    assert list(portfolios) == [finished]
+    assert service.get_portfolio_job(pending)["status"] == "pending"
+
+
+def test_job_store_is_bounded(service):
+    service._portfolio_jobs.maxsize = 2
+    job_ids = [service.start_portfolio_job(f"request {i}") for i in range(3)]
+
+    assert service.get_portfolio_job(job_ids[0]) is None
+    assert len(service._portfolio_jobs) == 2
+
+
+def test_finished_jobs_expire(service, monkeypatch):
+    job_id = service.start_portfolio_job("request")
+    asyncio.run(service.run_portfolio_job(job_id, "request"))
+
+    expired = time.monotonic() + service._portfolio_jobs.ttl + 1
+    monkeypatch.setattr(cache.time, "monotonic", lambda: expired)
+
+    assert service.get_portfolio_job(job_id) is None
+    assert service.get_cached_portfolios() == {}
@@ -0,0 +1,53 @@
+"""Regression tests for malformed and empty JSON request bodies."""
+
+import pytest
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@pytest.mark.parametrize(
+    ("path", "body"),
+    [
+        ("/api/v1/chat", b"{bad"),
+        ("/api/v1/memory/store", b"not json"),
+        ("/api/v1/portfolio/orchestrate", b"[1,"),
+    ],
+)
+def test_malformed_body_returns_422(client, path, body):
+    response = client.post(path, content=body, headers=JSON_HEADERS)
+
+    assert response.status_code == 422
+    payload = response.json()
+    assert payload["detail"][0]["type"] == "json_invalid"
+    assert payload["detail"][0]["loc"] == ["body"]
+    assert payload["body"] == body.decode()
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/v1/chat", "/api/v1/memory/store", "/api/v1/portfolio/orchestrate"]
+)
+def test_empty_body_returns_422(client, path):
+    response = client.post(path, content=b"", headers=JSON_HEADERS)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "missing"
+    assert response.json()["body"] is None
+
+
+def test_invalid_fields_report_parsed_body(client):
+    response = client.post("/api/v1/chat", json={"message": ""})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "message"]
+    assert response.json()["body"] == {"message": ""}
+
+
+def test_non_standard_json_literal_returns_422(client):
+    # Parsed by pydantic (NaN is accepted) but not by orjson
+    response = client.post(
+        "/api/v1/chat", content=b'{"message": NaN}', headers=JSON_HEADERS
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "string_type"
+    assert response.json()["body"] == '{"message": NaN}'
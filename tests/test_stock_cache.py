@@ -0,0 +1,47 @@
+"""Tests for the on-disk stock data cache in portfolio utils."""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from app.services import utils
+
+yfinance = pytest.importorskip("yfinance")
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Replace yfinance downloads with a fixed frame, recording each call."""
+    calls = []
+    frame = pd.DataFrame(
+        {"AAPL": [100.0, 101.0]}, index=pd.date_range("2024-01-01", periods=2)
+    )
+
+    def download(tickers, start, end):
+        calls.append(tickers)
+        return {"Adj Close": frame}
+
+    monkeypatch.setattr(yfinance, "download", download)
+    return calls
+
+
+def test_fresh_cache_file_skips_download(tmp_path, downloads):
+    cache_file = str(tmp_path / "stock" / "data.csv")
+
+    utils.get_stock_data(["AAPL"], "2024-01-01", "2024-01-03", cache_file)
+    utils.get_stock_data(["AAPL"], "2024-01-01", "2024-01-03", cache_file)
+
+    assert len(downloads) == 1
+
+
+def test_stale_cache_file_is_refetched(tmp_path, downloads):
+    cache_file = str(tmp_path / "data.csv")
+    utils.get_stock_data(["AAPL"], "2024-01-01", "2024-01-03", cache_file)
+
+    stale = time.time() - utils.STOCK_CACHE_TTL - 1
+    os.utime(cache_file, (stale, stale))
+    utils.get_stock_data(["AAPL"], "2024-01-01", "2024-01-03", cache_file)
+
+    assert len(downloads) == 2